@@ -9,7 +9,6 @@ from io import StringIO
 from pathlib import Path
 from typing import Callable
 
-from . import http as http_client
 from .fetch import run_fetch_list_phase, run_fetch_phase
 from .makefile import write_makefile
 from .options import parse_cli_args
@@ -129,6 +128,9 @@ def _render_site_rules(fmt: str) -> str:
 
 
 def _configure_http(options, log) -> None:
+    # Imported here so --help and --list-site-rules do not load requests.
+    from . import http as http_client
+
     sleep_min = getattr(options, "sleep_min", None)
     sleep_max = getattr(options, "sleep_max", None)
     if sleep_min is not None or sleep_max is not None:
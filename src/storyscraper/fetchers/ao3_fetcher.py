@@ -9,10 +9,11 @@ from io import BytesIO
 from pathlib import Path
 from urllib.parse import urljoin
 from zipfile import ZipFile
+from xml.etree import ElementTree as ET
 
 from bs4 import BeautifulSoup
-from xml.etree import ElementTree as ET
 
+from ..fileio import write_bytes
 from ..options import StoryScraperOptions, slugify
 from .auto import Fetcher as AutoFetcher
 
@@ -23,9 +24,13 @@ class Fetcher(AutoFetcher):
     download_selector = "li.download a[href*='epub']"
     title_selector = "h2.title"
     author_selector = "a[rel='author']"
+    _PARSE_LISTING = True
 
-    def _select_urls(self, base_url: str, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _select_urls(
+        self, base_url: str, html: str, *, soup: BeautifulSoup | None = None
+    ) -> list[str]:
+        if soup is None:
+            soup = self._make_soup(html)
         download_link = soup.select_one(self.download_selector)
         if download_link is None:
             raise ValueError("Unable to locate EPUB download link on AO3 page.")
@@ -41,8 +46,11 @@ class Fetcher(AutoFetcher):
         options: StoryScraperOptions,
         html: str,
         urls: list[str],
+        *,
+        soup: BeautifulSoup | None = None,
     ) -> StoryScraperOptions:
-        soup = BeautifulSoup(html, "html.parser")
+        if soup is None:
+            soup = self._make_soup(html)
         updated = options
 
         title_tag = soup.select_one(self.title_selector)
@@ -152,7 +160,7 @@ class Fetcher(AutoFetcher):
                 except KeyError:
                     continue
                 destination = html_dir / f"{prefix}{index:03d}.html"
-                destination.write_bytes(content)
+                write_bytes(destination, content)
                 generated.append(destination)
                 if progress_callback:
                     progress_callback(index, total, destination, False)
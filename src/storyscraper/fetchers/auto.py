@@ -2,24 +2,53 @@
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields as dataclass_fields
 from datetime import datetime
+from html.parser import HTMLParser
 from pathlib import Path, PurePosixPath
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 from urllib.parse import ParseResult, urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from ..fileio import write_bytes
 from ..http import fetch_bytes as http_fetch_bytes
 from ..options import StoryScraperOptions
 from . import ProgressCallback
 
 
+class _AnchorScanner(HTMLParser):
+    """Collect the non-empty href of every <a> tag, in document order."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "a":
+            return
+        # As in the tree builder, a repeated attribute keeps its last value.
+        href = dict(attrs).get("href")
+        if href:
+            self.hrefs.append(href)
+
+
 class Fetcher:
     """Auto fetcher implementation."""
 
     download_list_filename = "download_urls.txt"
+    # Single place to choose the tree builder for fetched pages.
+    HTML_PARSER = "html.parser"
     _OPTION_FIELDS = dataclass_fields(StoryScraperOptions)
+    # Subclasses that read the listing page's tree set this, so list_phase
+    # parses the page once and hands the soup to both listing hooks.
+    _PARSE_LISTING = False
+    # A single path segment that urljoin would append to the page's directory
+    # as-is: no scheme, slash, query, fragment, params or whitespace.
+    _PLAIN_HREF_RE = re.compile(r"[\w.~!$&'()*+,=@%-]+")
 
     def list_phase(
         self,
@@ -28,12 +57,14 @@ class Fetcher:
         stories_root: Path | None = None,
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
-        ordered_urls = self._select_urls(options.download_url, html)
+        soup = self._make_soup(html) if self._PARSE_LISTING else None
+        ordered_urls = self._select_urls(options.download_url, html, soup=soup)
 
         updated_options = self.postprocess_listing(
             options=options,
             html=html,
             urls=ordered_urls,
+            soup=soup,
         )
         options = self._sync_options(options, updated_options)
 
@@ -68,76 +99,129 @@ class Fetcher:
         fetched_files: list[Path] = []
 
         total = len(urls)
+        destinations = [
+            html_dir / f"{slug_value}-{index:03d}.html" for index in range(1, total + 1)
+        ]
+        # Decided up front so the downloads can be started ahead of the loop;
+        # one directory listing replaces a stat call per chapter.
+        with os.scandir(html_dir) as entries:
+            present = {entry.name for entry in entries}
+        skipped = [
+            destination.name in present and not force_fetch
+            for destination in destinations
+        ]
+        downloads = self._fetch_all(
+            [url for url, skip in zip(urls, skipped) if not skip],
+            options.fetch_workers,
+        )
 
-        for index, url in enumerate(urls, start=1):
-            destination = html_dir / f"{slug_value}-{index:03d}.html"
-            if destination.exists() and not force_fetch:
+        for index, (url, destination, skip) in enumerate(
+            zip(urls, destinations, skipped), start=1
+        ):
+            if skip:
                 if progress_callback:
                     progress_callback(index, total, destination, True)
                 continue
-            try:
-                data = self._fetch_bytes(url)
-            except (
-                Exception
-            ) as exc:  # pragma: no cover - network failures mocked in tests
-                self._log_failure(log_file, url, exc)
+            data = next(downloads)
+            if isinstance(data, Exception):
+                self._log_failure(log_file, url, data)
                 continue
 
-            destination.write_bytes(data)
+            write_bytes(destination, data)
             fetched_files.append(destination)
             if progress_callback:
                 progress_callback(index, total, destination, False)
 
         return fetched_files
 
+    def _fetch_all(
+        self, urls: Sequence[str], workers: int
+    ) -> Iterator[bytes | Exception]:
+        """Yield the bytes at each URL (or the raised exception), in order.
+
+        With more than one worker the downloads run on a thread pool; each
+        request still waits out its own jitter delay.
+        """
+
+        if workers < 2 or len(urls) < 2:
+            for url in urls:
+                try:
+                    yield self._fetch_bytes(url)
+                except Exception as exc:  # pragma: no cover
+                    # Network failures are mocked in tests.
+                    yield exc
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(workers, len(urls)))
+        try:
+            futures = [executor.submit(self._fetch_bytes, url) for url in urls]
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception as exc:
+                    yield exc
+        finally:
+            executor.shutdown(cancel_futures=True)
+
     def _fetch_text(self, url: str) -> str:
         return self._fetch_bytes(url).decode("utf-8", errors="replace")
 
     def _fetch_bytes(self, url: str) -> bytes:
         return http_fetch_bytes(url)
 
-    def _select_urls(self, base_url: str, html: str) -> list[str]:
+    def _make_soup(
+        self, html: str, *, parse_only: SoupStrainer | None = None
+    ) -> BeautifulSoup:
+        return BeautifulSoup(html, self.HTML_PARSER, parse_only=parse_only)
+
+    def _select_urls(
+        self, base_url: str, html: str, *, soup: BeautifulSoup | None = None
+    ) -> list[str]:
         hrefs = self._extract_links(html)
         canonical = _canonicalize_url(base_url)
         return self._filter_links(base_url, hrefs, canonical)
 
     def _extract_links(self, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        hrefs: list[str] = []
-        for anchor in soup.find_all("a", href=True):
-            href_value = anchor.get("href")
-            if isinstance(href_value, str) and href_value:
-                hrefs.append(href_value)
-            elif isinstance(href_value, Sequence):
-                for value in href_value:
-                    if isinstance(value, str) and value:
-                        hrefs.append(value)
-        return hrefs
+        # Only the anchors' href values are needed, so the page is tokenized
+        # without building a tree for it.
+        scanner = _AnchorScanner()
+        scanner.feed(html)
+        scanner.close()
+        return scanner.hrefs
 
     def _filter_links(
         self, base_url: str, hrefs: Iterable[str], canonical_url: str | None
     ) -> list[str]:
         parsed_base = urlparse(base_url)
         base_dir = _compute_base_directory(parsed_base.path)
-        ordered: list[str] = []
+        found: list[str] = []
 
-        def add_url(url: str) -> None:
-            if url not in ordered:
-                ordered.append(url)
+        # Chapter links are mostly bare file names next to the index page.
+        # Those are joined by hand; everything else still goes via urljoin.
+        directory_url = urljoin(base_url, "x")[:-1]
+        directory_in_scope = _in_scope(
+            parsed_base, urlparse(f"{directory_url}x"), base_dir
+        )
 
         for href in hrefs:
+            if href not in (".", "..") and self._PLAIN_HREF_RE.fullmatch(href):
+                if directory_in_scope:
+                    found.append(directory_url + href)
+                continue
             absolute = urljoin(base_url, href)
             parsed_candidate = urlparse(absolute)
             if _in_scope(parsed_base, parsed_candidate, base_dir):
-                add_url(absolute)
+                found.append(absolute)
 
         self_urls = [base_url]
         if canonical_url is not None:
             self_urls.append(canonical_url)
 
+        # dict.fromkeys drops repeated links in one pass, keeping first-seen
+        # order.
         return [
             url
-            for url in ordered
+            for url in dict.fromkeys(found)
             if not any(_urls_equal(url, self_url) for self_url in self_urls)
         ]
 
@@ -156,15 +240,16 @@ class Fetcher:
     def _write_download_list(self, story_dir: Path, urls: list[str]) -> None:
         story_dir.mkdir(parents=True, exist_ok=True)
         destination = story_dir / self.download_list_filename
-        with destination.open("w", encoding="utf-8") as handle:
-            for url in urls:
-                handle.write(f"{url}\n")
+        content = "\n".join(urls) + ("\n" if urls else "")
+        destination.write_text(content, encoding="utf-8")
 
     def postprocess_listing(
         self,
         options: StoryScraperOptions,
         html: str,
         urls: list[str],
+        *,
+        soup: BeautifulSoup | None = None,
     ) -> StoryScraperOptions:
         """Hook for subclasses to mutate options after listing but before writing files."""
 
@@ -25,7 +25,7 @@ class Fetcher(AutoFetcher):
         stories_root: Path | None = None,
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
 
         story_id = self._story_id_from_url(options.download_url)
         ordered_urls = self._extract_chapter_urls(
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import replace
 import json
 import re
 from pathlib import Path
-from urllib.parse import parse_qs, urljoin, urlparse, urlunparse
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
 
 from bs4 import BeautifulSoup
 
@@ -21,6 +22,9 @@ class Fetcher(AutoFetcher):
     og_url_selector = "meta[property='og:url']"
     title_selector = "title"
     literature_heading = "Literature Text"
+    _INITIAL_STATE_RE = re.compile(
+        r'window\.__INITIAL_STATE__\s*=\s*JSON\.parse\("(.*?)"\);', re.DOTALL
+    )
 
     def list_phase(
         self,
@@ -30,7 +34,7 @@ class Fetcher(AutoFetcher):
     ) -> list[str]:
         if self._is_gallery_url(options.download_url):
             first_html = self._fetch_text(options.download_url)
-            first_soup = BeautifulSoup(first_html, "html.parser")
+            first_soup = self._make_soup(first_html)
             ordered_urls = self._collect_gallery_urls(
                 options.download_url,
                 first_html,
@@ -53,7 +57,7 @@ class Fetcher(AutoFetcher):
             return ordered_urls
 
         html = self._fetch_text(options.download_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
 
         if not self._has_literature_content(soup):
             self._warn_non_literature(options.download_url)
@@ -200,50 +204,97 @@ class Fetcher(AutoFetcher):
         current_soup: BeautifulSoup | None = soup
         current_html: str | None = first_html
         total_pages: int | None = None
+        prefetched: dict[str, Future[str]] = {}
+        executor: ThreadPoolExecutor | None = None
 
-        while next_url:
-            if next_url in seen_pages:
-                break
-            seen_pages.add(next_url)
+        try:
+            while next_url:
+                if next_url in seen_pages:
+                    break
+                seen_pages.add(next_url)
+
+                if current_soup is None:
+                    pending = prefetched.pop(next_url, None)
+                    if pending is not None:
+                        current_html = pending.result()
+                    else:
+                        # The chain left the guessed URLs; the rest of them
+                        # would only be downloaded a second time.
+                        for future in prefetched.values():
+                            future.cancel()
+                        prefetched.clear()
+                        current_html = self._fetch_text(next_url)
+                    current_soup = self._make_soup(current_html)
+
+                page_number, page_total = self._extract_gallery_page_info(
+                    current_html or "",
+                    next_url,
+                )
+                if page_total is not None:
+                    total_pages = page_total
+                self._log_gallery_page_fetch(
+                    options=options,
+                    url=next_url,
+                    page_number=page_number,
+                    total_pages=total_pages,
+                )
 
-            if current_soup is None:
-                current_html = self._fetch_text(next_url)
-                current_soup = BeautifulSoup(current_html, "html.parser")
+                new_count = self._extract_gallery_urls_from_soup(
+                    base_url=next_url,
+                    soup=current_soup,
+                    username=username,
+                    ordered=ordered,
+                    seen=seen,
+                )
+                self._log_gallery_page_result(
+                    options=options,
+                    page_number=page_number,
+                    total_pages=total_pages,
+                    new_count=new_count,
+                )
+                next_url = self._extract_next_gallery_page(current_soup, next_url)
+                if (
+                    executor is None
+                    and next_url is not None
+                    and options.fetch_workers > 1
+                    and page_number is not None
+                    and total_pages is not None
+                    and page_number < total_pages
+                ):
+                    page_urls = self._gallery_page_urls(
+                        base_url, page_number + 1, total_pages
+                    )
+                    # Only prefetch once the guess agrees with the real next
+                    # link, or every page would be fetched twice.
+                    if page_urls[0] == next_url:
+                        executor = ThreadPoolExecutor(max_workers=options.fetch_workers)
+                        prefetched = {
+                            url: executor.submit(self._fetch_text, url)
+                            for url in page_urls
+                        }
+                if total_pages is not None and page_number is not None:
+                    if page_number >= total_pages:
+                        break
+                current_soup = None
+                current_html = None
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
-            page_number, page_total = self._extract_gallery_page_info(
-                current_html or "",
-                next_url,
-            )
-            if page_total is not None:
-                total_pages = page_total
-            self._log_gallery_page_fetch(
-                options=options,
-                url=next_url,
-                page_number=page_number,
-                total_pages=total_pages,
-            )
+        return ordered
 
-            new_count = self._extract_gallery_urls_from_soup(
-                base_url=next_url,
-                soup=current_soup,
-                username=username,
-                ordered=ordered,
-                seen=seen,
-            )
-            self._log_gallery_page_result(
-                options=options,
-                page_number=page_number,
-                total_pages=total_pages,
-                new_count=new_count,
-            )
-            next_url = self._extract_next_gallery_page(current_soup, next_url)
-            if total_pages is not None and page_number is not None:
-                if page_number >= total_pages:
-                    break
-            current_soup = None
-            current_html = None
+    def _gallery_page_urls(
+        self, base_url: str, first_page: int, last_page: int
+    ) -> list[str]:
+        """Return the ?page=N URLs DeviantArt normally links a gallery's pages as."""
 
-        return ordered
+        parsed = urlparse(base_url)
+        query = parse_qs(parsed.query, keep_blank_values=True)
+        urls: list[str] = []
+        for page in range(first_page, last_page + 1):
+            query["page"] = [str(page)]
+            urls.append(urlunparse(parsed._replace(query=urlencode(query, doseq=True))))
+        return urls
 
     def _extract_gallery_urls_from_soup(
         self,
@@ -312,11 +363,7 @@ class Fetcher(AutoFetcher):
         return page_number, total_pages
 
     def _extract_initial_state(self, html: str) -> dict[str, object] | None:
-        match = re.search(
-            r'window\.__INITIAL_STATE__\s*=\s*JSON\.parse\("(.*?)"\);',
-            html,
-            re.DOTALL,
-        )
+        match = self._INITIAL_STATE_RE.search(html)
         if match is None:
             return None
         raw = match.group(1)
@@ -332,6 +379,13 @@ class Fetcher(AutoFetcher):
         return None
 
     def _unescape_js_string(self, value: str) -> str | None:
+        try:
+            # The payload is normally a valid JSON string body, which the C
+            # scanner decodes in one pass.
+            return json.loads(f'"{value}"', strict=False)
+        except json.JSONDecodeError:
+            pass
+        # JS-only escapes such as \' need the character-by-character walk.
         output: list[str] = []
         i = 0
         length = len(value)
@@ -10,6 +10,7 @@ from urllib.parse import parse_qs, urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
 
+from ..fileio import write_bytes
 from ..options import StoryScraperOptions, slugify
 from .auto import Fetcher as AutoFetcher
 
@@ -24,7 +25,7 @@ class Fetcher(AutoFetcher):
         stories_root: Path | None = None,
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
 
         story_id = self._story_id_from_url(options.download_url)
         parts_url = self._find_parts_url(soup, options.download_url, story_id)
@@ -88,7 +89,7 @@ class Fetcher(AutoFetcher):
                 self._log_failure(log_file, url, exc)
                 continue
 
-            destination.write_text(synthetic_html, encoding="utf-8")
+            write_bytes(destination, synthetic_html.encode("utf-8"))
             fetched_files.append(destination)
             if progress_callback:
                 progress_callback(index, total, destination, False)
@@ -113,7 +114,7 @@ class Fetcher(AutoFetcher):
         return None
 
     def _extract_parts(self, html: str, *, base_url: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
         ordered: list[str] = []
         seen: set[str] = set()
         for anchor in soup.find_all("a", href=True):
@@ -133,13 +134,13 @@ class Fetcher(AutoFetcher):
 
     def _fetch_and_stitch(self, url: str) -> str:
         primary_html = self._fetch_text(url)
-        primary_soup = BeautifulSoup(primary_html, "html.parser")
+        primary_soup = self._make_soup(primary_html)
         rest_url = self._find_rest_url(primary_soup, base_url=url)
 
         rest_soup: BeautifulSoup | None = None
         if rest_url:
             rest_html = self._fetch_text(rest_url)
-            rest_soup = BeautifulSoup(rest_html, "html.parser")
+            rest_soup = self._make_soup(rest_html)
 
         content_blocks = []
         primary_block = self._extract_content_block(primary_soup)
@@ -188,7 +189,7 @@ class Fetcher(AutoFetcher):
         if not filtered_children:
             return parent
 
-        cleaned = BeautifulSoup("", "html.parser").new_tag("div")
+        cleaned = self._make_soup("").new_tag("div")
         for child in filtered_children:
             cleaned.append(child)
         return cleaned
@@ -211,7 +212,7 @@ class Fetcher(AutoFetcher):
         secondary_soup: BeautifulSoup | None,
         content_blocks: list[Tag],
     ) -> str:
-        doc = BeautifulSoup("", "html.parser")
+        doc = self._make_soup("")
         html_tag = doc.new_tag("html")
         head_tag = doc.new_tag("head")
         body_tag = doc.new_tag("body")
@@ -245,7 +246,7 @@ class Fetcher(AutoFetcher):
     def _update_options(
         self, options: StoryScraperOptions, html: str
     ) -> StoryScraperOptions:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
         title = self._extract_title(soup)
         author = self._extract_author(soup)
 
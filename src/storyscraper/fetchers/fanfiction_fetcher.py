@@ -17,9 +17,13 @@ class Fetcher(AutoFetcher):
     _CHAPTER_SELECT_ID = "chap_select"
     _TITLE_SELECTOR = "b.xcontrast_txt"
     _AUTHOR_SELECTOR = "a.xcontrast_txt[href^='/u/']"
+    _PARSE_LISTING = True
 
-    def _select_urls(self, base_url: str, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _select_urls(
+        self, base_url: str, html: str, *, soup: BeautifulSoup | None = None
+    ) -> list[str]:
+        if soup is None:
+            soup = self._make_soup(html)
         select = soup.find(id=self._CHAPTER_SELECT_ID)
         base_story_url, slug = self._story_base_url(base_url)
 
@@ -43,8 +47,11 @@ class Fetcher(AutoFetcher):
         options: StoryScraperOptions,
         html: str,
         urls: list[str],
+        *,
+        soup: BeautifulSoup | None = None,
     ) -> StoryScraperOptions:
-        soup = BeautifulSoup(html, "html.parser")
+        if soup is None:
+            soup = self._make_soup(html)
         updated = options
 
         title_tag = soup.select_one(self._TITLE_SELECTOR)
@@ -28,7 +28,7 @@ class Fetcher(AutoFetcher):
         stories_root: Path | None = None,
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
 
         ordered_urls, locked_count = self._extract_chapters(
             soup, base_url=options.download_url
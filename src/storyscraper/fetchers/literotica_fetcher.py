@@ -12,8 +12,8 @@ from typing import Any
 from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import requests
-from bs4 import BeautifulSoup
 
+from ..fileio import write_bytes
 from ..options import StoryScraperOptions, slugify
 from . import ProgressCallback
 from .auto import Fetcher as AutoFetcher
@@ -72,7 +72,7 @@ class Fetcher(AutoFetcher):
                 self._log_failure(log_file, url, exc)
                 continue
 
-            destination.write_bytes(data)
+            write_bytes(destination, data)
             fetched_files.append(destination)
             if progress_callback:
                 progress_callback(index, total, destination, False)
@@ -86,14 +86,16 @@ class Fetcher(AutoFetcher):
         stories_root: Path | None,
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
-        works = self._extract_series_works(html)
+        # The state payload feeds both the chapter list and the metadata.
+        state = self._load_state_payload(html)
+        works = self._extract_series_works(state)
         ordered_urls = [self._chapter_url(work) for work in works]
         ordered_urls = [url for url in ordered_urls if url]
 
         if not ordered_urls:
             return super().list_phase(options, stories_root=stories_root)
 
-        updated_options = self._update_options_from_series(options, html)
+        updated_options = self._update_options_from_series(options, state)
         options = self._sync_options(options, updated_options)
 
         base_root = Path(stories_root) if stories_root is not None else Path("stories")
@@ -119,8 +121,9 @@ class Fetcher(AutoFetcher):
         self._write_download_list(story_dir, ordered_urls)
         return ordered_urls
 
-    def _extract_series_works(self, html: str) -> list[dict[str, Any]]:
-        state = self._load_state_payload(html)
+    def _extract_series_works(
+        self, state: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
         if not state:
             return []
         series = state.get("series", {})
@@ -138,9 +141,8 @@ class Fetcher(AutoFetcher):
     def _update_options_from_series(
         self,
         options: StoryScraperOptions,
-        html: str,
+        state: dict[str, Any] | None,
     ) -> StoryScraperOptions:
-        state = self._load_state_payload(html)
         if not state:
             return options
 
@@ -305,7 +307,7 @@ class Fetcher(AutoFetcher):
         )
 
     def _extract_article_metadata(self, html: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
         scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
         for script in scripts:
             data = self._parse_ld_json(script.string)
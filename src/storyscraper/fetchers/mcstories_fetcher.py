@@ -14,13 +14,18 @@ from .auto import Fetcher as AutoFetcher
 class Fetcher(AutoFetcher):
     """Fetch MCStories chapters with title/slug inference."""
 
+    _PARSE_LISTING = True
+
     def postprocess_listing(
         self,
         options: StoryScraperOptions,
         html: str,
         urls: list[str],
+        *,
+        soup: BeautifulSoup | None = None,
     ) -> StoryScraperOptions:
-        soup = BeautifulSoup(html, "html.parser")
+        if soup is None:
+            soup = self._make_soup(html)
         options = self._apply_title(options, soup)
         options = self._apply_author(options, soup)
         return options
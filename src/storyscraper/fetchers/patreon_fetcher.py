@@ -22,6 +22,7 @@ from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
+from ..fileio import write_bytes
 from ..http import get as http_get
 from ..options import StoryScraperOptions, slugify
 from .auto import Fetcher as AutoFetcher
@@ -43,9 +44,10 @@ class Fetcher(AutoFetcher):
     ) -> list[str]:
         html = self._fetch_text(options.download_url)
         collection_id = self._extract_collection_id(options.download_url, html)
-        metadata = self._extract_metadata_from_ldjson(html)
+        soup = self._make_soup(html)
+        metadata = self._extract_metadata_from_ldjson(soup)
         metadata = metadata or self._extract_metadata_from_next_data(html)
-        fallback = self._extract_metadata_from_title(html)
+        fallback = self._extract_metadata_from_title(soup)
         if fallback:
             metadata = {**(metadata or {}), **fallback}
         api_root = self.collection_api_template.format(collection_id=collection_id)
@@ -101,7 +103,7 @@ class Fetcher(AutoFetcher):
                 self._log_failure(log_file, url, exc)
                 continue
 
-            destination.write_bytes(data)
+            write_bytes(destination, data)
             fetched_files.append(destination)
             if progress_callback:
                 progress_callback(index, total, destination, False)
@@ -146,8 +148,9 @@ class Fetcher(AutoFetcher):
     def _post_url_from_id(self, post_id: str) -> str:
         return f"https://www.patreon.com/posts/{post_id}"
 
-    def _extract_metadata_from_ldjson(self, html: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_metadata_from_ldjson(
+        self, soup: BeautifulSoup
+    ) -> dict[str, Any] | None:
         scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
         for script in scripts:
             text = script.string
@@ -280,8 +283,9 @@ class Fetcher(AutoFetcher):
                     return value.strip()
         return None
 
-    def _extract_metadata_from_title(self, html: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_metadata_from_title(
+        self, soup: BeautifulSoup
+    ) -> dict[str, Any] | None:
         if soup.title and soup.title.string:
             text = soup.title.string.strip()
             parts = [part.strip() for part in text.split("|") if part.strip()]
@@ -17,14 +17,19 @@ class Fetcher(AutoFetcher):
 
     toc_selector = "ul.table-of-contents"
     funbar_selector = "#funbar-story span.info"
+    _PARSE_LISTING = True
 
-    def _select_urls(self, base_url: str, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _select_urls(
+        self, base_url: str, html: str, *, soup: BeautifulSoup | None = None
+    ) -> list[str]:
+        if soup is None:
+            soup = self._make_soup(html)
         toc = soup.select_one(self.toc_selector)
         if toc is None:
             return super()._select_urls(base_url, html)
 
         seen: set[str] = set()
+        seen_hrefs: set[str] = set()
         ordered: list[str] = []
         locked = 0
 
@@ -33,8 +38,12 @@ class Fetcher(AutoFetcher):
                 locked += 1
                 continue
             href = anchor.get("href")
-            if not isinstance(href, str) or not href.strip():
+            if not isinstance(href, str) or not href.lstrip():
                 continue
+            # Duplicate TOC entries resolve to the same URL; skip the join.
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
             absolute = urljoin(base_url, href)
             if absolute not in seen:
                 seen.add(absolute)
@@ -53,8 +62,11 @@ class Fetcher(AutoFetcher):
         options: StoryScraperOptions,
         html: str,
         urls: list[str],
+        *,
+        soup: BeautifulSoup | None = None,
     ) -> StoryScraperOptions:
-        soup = BeautifulSoup(html, "html.parser")
+        if soup is None:
+            soup = self._make_soup(html)
         info = soup.select_one(self.funbar_selector)
         if info is None:
             return options
@@ -0,0 +1,26 @@
+"""File helpers shared by the fetch and transform phases."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Without O_BINARY, Windows opens the descriptor in text mode and os.write
+# turns every "\n" into "\r\n"; elsewhere the flag does not exist.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes(destination: Path, data: bytes) -> None:
+    """Write data to destination unchanged, with plain os-level writes.
+
+    The payload is already complete in memory, so the buffered file layer
+    would only copy it once more on its way to the descriptor.
+    """
+
+    view = memoryview(data)
+    descriptor = os.open(destination, _WRITE_FLAGS, 0o666)
+    try:
+        while view:
+            view = view[os.write(descriptor, view) :]
+    finally:
+        os.close(descriptor)
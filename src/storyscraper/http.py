@@ -8,6 +8,7 @@ from http.cookiejar import CookieJar
 from typing import Any, Mapping
 
 import requests
+from requests.adapters import HTTPAdapter
 
 _USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:145.0) Gecko/20100101 Firefox/145.0"
 _DEFAULT_HEADERS = {
@@ -29,14 +30,30 @@ _DEFAULT_HEADERS = {
 _DEFAULT_TIMEOUT = 30.0
 _MIN_DELAY_SECONDS = 0.2
 _MAX_DELAY_SECONDS = 1.2
-_SESSION = requests.Session()
+# requests pools 10 connections per host by default; with more fetch workers
+# than that, the surplus connections are dropped after every response and
+# reopened on the next request to the same host.
+_POOL_MAXSIZE = 16
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    if hasattr(session, "mount"):
+        # One adapter for both schemes, sized for parallel chapter downloads.
+        adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _new_session()
 
 
 def configure_session(*, cookies: CookieJar | None = None) -> None:
     """Configure the default HTTP session."""
 
     global _SESSION
-    _SESSION = requests.Session()
+    _SESSION = _new_session()
     if hasattr(_SESSION, "headers"):
         _SESSION.headers.update(_DEFAULT_HEADERS)
     if cookies is not None:
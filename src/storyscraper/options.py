@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Sequence
 from urllib.parse import urlparse, unquote
@@ -37,6 +38,7 @@ class StoryScraperOptions:
     cookies_from_browser: str | None = None
     sleep_min: float | None = None
     sleep_max: float | None = None
+    fetch_workers: int = 1
     from_file: str | None = None
     list_site_rules_format: str | None = None
     invocation_command: str | None = None
@@ -57,8 +59,9 @@ class StoryScraperOptions:
         return self.author or self.chosen_author or "Unknown"
 
 
-def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
-    """Parse CLI arguments into a dataclass."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parsing does not modify it."""
 
     parser = argparse.ArgumentParser(
         prog="storyscraper",
@@ -98,13 +101,14 @@ def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
         action="store_true",
         help="Force re-downloading chapters even if HTML files already exist.",
     )
-    parser.add_argument(
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
         "--quiet",
         "-q",
         action="store_true",
         help="Suppress progress output (errors only).",
     )
-    parser.add_argument(
+    verbosity.add_argument(
         "--verbose",
         "-v",
         action="store_true",
@@ -126,6 +130,13 @@ def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
         type=float,
         help="Maximum jitter delay between requests (seconds).",
     )
+    parser.add_argument(
+        "--fetch-workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of chapters to download at once (default: 1).",
+    )
     parser.add_argument(
         "--from-file",
         "-f",
@@ -144,7 +155,13 @@ def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
         nargs="?",
         help="URL to download; required unless --from-file is set.",
     )
+    return parser
+
+
+def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
+    """Parse CLI arguments into a dataclass."""
 
+    parser = _build_parser()
     args = parser.parse_args(argv)
     if args.list_site_rules and (args.from_file or args.download_url):
         parser.error("--list-site-rules cannot be combined with download URLs.")
@@ -168,8 +185,8 @@ def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
         download_url = args.download_url
         from_file = None
 
-    if args.quiet and args.verbose:
-        parser.error("--quiet and --verbose cannot be combined.")
+    if args.fetch_workers < 1:
+        parser.error("--fetch-workers must be at least 1.")
 
     name = args.name
     chosen_name = name or _derive_name_from_url(download_url)
@@ -212,6 +229,7 @@ def parse_cli_args(argv: Sequence[str] | None = None) -> StoryScraperOptions:
         cookies_from_browser=cookies_from_browser,
         sleep_min=args.sleep_min,
         sleep_max=args.sleep_max,
+        fetch_workers=args.fetch_workers,
         from_file=from_file,
         list_site_rules_format=args.list_site_rules,
         invocation_command=invocation_command,
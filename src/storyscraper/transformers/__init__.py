@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, Callable
@@ -27,7 +28,13 @@ class Transformer(Protocol):
 def load_transformer(name: str) -> Transformer:
     """Instantiate a transformer implementation."""
 
-    module_name = name or "auto"
+    return _transformer_class(name or "auto")()
+
+
+@lru_cache(maxsize=32)
+def _transformer_class(module_name: str) -> type[Transformer]:
+    """Resolve (and remember) the Transformer class for a module name."""
+
     module_path = f"{__name__}.{module_name}"
     module = import_module(module_path)
     transformer_cls = getattr(module, "Transformer", None)
@@ -35,4 +42,4 @@ def load_transformer(name: str) -> Transformer:
         raise ImportError(
             f"Transformer module '{module_name}' missing Transformer class"
         )
-    return transformer_cls()
+    return transformer_cls
@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as html_to_markdown
+import soupsieve
 
-from .auto import Transformer as AutoTransformer
+from .auto import Transformer as AutoTransformer, html_to_markdown
 
 
 class Transformer(AutoTransformer):
     """Select AO3's userstuff content and headings."""
 
     _CONTENT_SELECTOR = ".userstuff"
-    _HEADING_SELECTOR = ".heading"
+    _HEADING_SELECTOR = soupsieve.compile(".heading")
 
     def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        heading_tag = soup.select_one(self._HEADING_SELECTOR)
+        soup = self._make_soup(html)
+        heading_tag = self._HEADING_SELECTOR.select_one(soup)
         body = soup.body or soup
 
         markdown = html_to_markdown(str(body))
@@ -2,21 +2,61 @@
 
 from __future__ import annotations
 
+import copy
+import importlib
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import pairwise
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Iterator, Sequence, TypeVar
 
-from bs4 import BeautifulSoup, Tag
-from markdownify import markdownify as html_to_markdown
+import soupsieve
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+from markdownify import MarkdownConverter
 
 from . import ProgressCallback
+from ..fileio import write_bytes
 from ..options import StoryScraperOptions
 
+_T = TypeVar("_T")
+
+# One converter for every document: markdownify() builds a new one, with an
+# empty per-tag dispatch cache, on each call.
+MARKDOWN_CONVERTER = MarkdownConverter()
+html_to_markdown = MARKDOWN_CONVERTER.convert
+
+orjson: Any | None
+try:
+    orjson = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def load_json(text: str) -> object:
+    """Decode JSON text, using orjson when it is installed."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, oversized integers and lone surrogates,
+            # which the standard library accepts.
+            pass
+    return json.loads(text)
+
 
 class Transformer:
     """Auto transformer that extracts story content and converts it to Markdown."""
 
     MARKDOWN_EXTENSION = ".md"
+    # Single place to choose the tree builder for chapter documents.
+    HTML_PARSER = "html.parser"
+    # Below this many chapters, conversion stays in-process: spawning worker
+    # processes costs more than it saves.
+    PARALLEL_MIN_FILES = 8
     _CHROME_SELECTORS = [
         "nav",
         "header",
@@ -25,6 +65,9 @@ class Transformer:
         '[role="banner"]',
         '[role="contentinfo"]',
     ]
+    # Compiled once here rather than on every select() call.
+    _CHROME_SELECTOR = soupsieve.compile(", ".join(_CHROME_SELECTORS))
+    _TEXT_STRING_TYPES = (NavigableString, CData)
     _ARTICLE_KEYWORDS = (
         "article",
         "blogposting",
@@ -40,7 +83,8 @@ class Transformer:
         progress_callback: ProgressCallback | None = None,
     ) -> list[Path]:
         base_root = Path(stories_root) if stories_root is not None else Path("stories")
-        story_dir = base_root / options.effective_slug()
+        slug_value = options.effective_slug()
+        story_dir = base_root / slug_value
         html_dir = story_dir / "html"
         markdown_dir = story_dir / "markdown"
         log_file = story_dir / "transform.log"
@@ -53,14 +97,17 @@ class Transformer:
         markdown_dir.mkdir(parents=True, exist_ok=True)
 
         generated: list[Path] = []
-        html_files = sorted(html_dir.glob("*.html"))
+        html_files = self._list_html_files(html_dir)
         total = len(html_files)
-        for index, html_path in enumerate(html_files, start=1):
-            destination = markdown_dir / f"{options.effective_slug()}-{index:03d}.md"
+        results = self._convert_html_files(html_files)
+        for index, (html_path, markdown) in enumerate(
+            zip(html_files, results), start=1
+        ):
+            destination = markdown_dir / f"{slug_value}-{index:03d}.md"
             try:
-                html_text = html_path.read_text(encoding="utf-8")
-                markdown = self._convert_html_to_markdown(html_text)
-                destination.write_text(markdown, encoding="utf-8")
+                if isinstance(markdown, Exception):
+                    raise markdown
+                write_markdown(destination, markdown)
                 generated.append(destination)
                 if progress_callback:
                     progress_callback(index, total, destination, False)
@@ -69,8 +116,105 @@ class Transformer:
 
         return generated
 
+    def _list_html_files(self, html_dir: Path) -> list[Path]:
+        """Return the chapter HTML files in html_dir, sorted by name."""
+
+        with os.scandir(html_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.name.endswith(".html")
+            )
+        return [html_dir / name for name in names]
+
+    def _convert_html_files(
+        self, html_paths: Sequence[Path]
+    ) -> Iterator[str | Exception]:
+        """Yield the Markdown (or the raised exception) for each file, in order."""
+
+        if self._parallel_workers(len(html_paths)):
+            yield from self._convert_in_parallel("_convert_html_file", html_paths)
+            return
+        for _, pending_text in self._read_ahead(html_paths):
+            try:
+                yield self._convert_html_to_markdown(pending_text.result())
+            except Exception as exc:  # pragma: no cover - logged by the caller
+                yield exc
+
+    def _convert_html_file(self, html_path: Path) -> str:
+        return self._convert_html_to_markdown(read_html_text(html_path))
+
+    def _read_ahead(
+        self, html_paths: Sequence[Path]
+    ) -> Iterator[tuple[Path, Future[str]]]:
+        """Yield each path with its pending text while the next file is read."""
+
+        if not html_paths:
+            return
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            current = reader.submit(read_html_text, html_paths[0])
+            for html_path, next_path in pairwise(html_paths):
+                upcoming = reader.submit(read_html_text, next_path)
+                yield html_path, current
+                current = upcoming
+            yield html_paths[-1], current
+
+    def _parallel_workers(self, count: int) -> int:
+        """Return how many worker processes to use for count items, or 0."""
+
+        workers = min(count, os.cpu_count() or 1)
+        if count < self.PARALLEL_MIN_FILES or workers < 2:
+            return 0
+        return workers
+
+    def _convert_in_parallel(
+        self,
+        method_name: str,
+        items: Sequence[_T],
+    ) -> Iterator[Any | Exception]:
+        """Yield each item's converted result (or the raised exception), in order."""
+
+        workers = self._parallel_workers(len(items))
+        if not workers:
+            convert = getattr(self, method_name)
+            for item in items:
+                try:
+                    yield convert(item)
+                except Exception as exc:  # pragma: no cover - logged by the caller
+                    yield exc
+            return
+
+        # Workers receive the class and method name, not a bound method, so
+        # the transformer instance itself is never pickled.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_convert_in_worker, type(self), method_name, item)
+                for item in items
+            ]
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception as exc:  # pragma: no cover - logged by the caller
+                    yield exc
+
+    def _make_soup(
+        self, html: str, *, parse_only: SoupStrainer | None = None
+    ) -> BeautifulSoup:
+        return BeautifulSoup(html, self.HTML_PARSER, parse_only=parse_only)
+
     def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+        return self._convert_soup_to_markdown(self._make_soup(html))
+
+    def _convert_fragment_to_markdown(self, fragment: Tag) -> str:
+        """Convert an already-parsed fragment without serializing and re-parsing it.
+
+        The fragment is moved out of its tree into a document of its own, so
+        callers must not use it afterwards.
+        """
+
+        soup = self._make_soup("")
+        soup.append(fragment.extract())
+        return self._convert_soup_to_markdown(soup)
+
+    def _convert_soup_to_markdown(self, soup: BeautifulSoup) -> str:
         root = self.extract_content_root(soup)
         return html_to_markdown(str(root))
 
@@ -132,42 +276,72 @@ class Transformer:
         return any(keyword in combined for keyword in self._ARTICLE_KEYWORDS)
 
     def _structured_layout_candidate(self, soup: BeautifulSoup) -> Tag | None:
-        if soup.body is None:
+        body = soup.body
+        if body is None:
             return None
 
-        body_clone = BeautifulSoup(str(soup.body), "html.parser").body
-        if body_clone is None:
-            return None
-
-        for selector in self._CHROME_SELECTORS:
-            for element in body_clone.select(selector):
-                element.decompose()
+        chrome_ids = {id(element) for element in self._CHROME_SELECTOR.select(body)}
+
+        # One pre-order walk that skips chrome subtrees instead of cloning the
+        # body and decomposing them first.
+        nodes: list[_LayoutNode] = []
+        stack: list[tuple[Tag, int, _LayoutNode | None]] = [(body, 0, None)]
+        while stack:
+            element, depth, parent = stack.pop()
+            node = _LayoutNode(element, depth, parent)
+            nodes.append(node)
+            for child in reversed(element.contents):
+                if isinstance(child, Tag):
+                    if id(child) in chrome_ids:
+                        node.has_chrome = True
+                    else:
+                        stack.append((child, depth + 1, node))
+                elif (
+                    isinstance(child, NavigableString)
+                    and type(child) in self._TEXT_STRING_TYPES
+                ):
+                    stripped = child.strip()
+                    if stripped:
+                        node.string_count += 1
+                        node.text_length += len(stripped)
+
+        # Children follow their parent in pre-order, so walking backwards
+        # folds every subtree into its parent before the parent is read.
+        for node in reversed(nodes):
+            parent = node.parent
+            if parent is None:
+                continue
+            parent.string_count += node.string_count
+            parent.text_length += node.text_length
+            parent.has_heading |= node.has_heading or node.element.name in ("h1", "h2")
+            parent.has_chrome |= node.has_chrome
 
-        best: Tag | None = None
-        best_depth = -1
+        best: _LayoutNode | None = None
         best_length = 0
 
-        for element in body_clone.find_all(True):
-            if element.find(["h1", "h2"]) is None:
+        for node in nodes[1:]:
+            if not node.has_heading or node.string_count == 0:
                 continue
-            length = self._visible_text_length(element)
-            if length == 0:
-                continue
-            depth = self._node_depth(element)
-            if depth > best_depth or (depth == best_depth and length > best_length):
-                best = element
-                best_depth = depth
+            # Matches len(get_text(separator=" ", strip=True)).
+            length = node.text_length + node.string_count - 1
+            if (
+                best is None
+                or node.depth > best.depth
+                or (node.depth == best.depth and length > best_length)
+            ):
+                best = node
                 best_length = length
 
-        return best
+        if best is None:
+            return None
 
-    def _node_depth(self, element: Tag) -> int:
-        depth = 0
-        current = element
-        while current.parent is not None:
-            depth += 1
-            current = current.parent  # type: ignore[assignment]
-        return depth
+        # Only the winning subtree is copied, so callers never mutate the
+        # page they passed in.
+        cleaned = copy.copy(best.element)
+        if best.has_chrome:
+            for element in self._CHROME_SELECTOR.select(cleaned):
+                element.decompose()
+        return cleaned
 
     def _stringify_itemtype(self, value: object) -> str:
         if not value:
@@ -184,3 +358,50 @@ class Transformer:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         with log_file.open("a", encoding="utf-8") as handle:
             handle.write(message)
+
+
+@dataclass(slots=True)
+class _LayoutNode:
+    """Visible-text totals for one element's subtree, chrome excluded."""
+
+    element: Tag
+    depth: int
+    parent: _LayoutNode | None
+    string_count: int = 0
+    text_length: int = 0
+    has_heading: bool = False
+    has_chrome: bool = False
+
+
+# One transformer per class in each worker process, built on first use.
+_WORKER_TRANSFORMERS: dict[type[Transformer], Transformer] = {}
+
+
+def _convert_in_worker(
+    transformer_cls: type[Transformer], method_name: str, item: object
+) -> Any:
+    """Run one conversion in a worker process, reusing its transformer."""
+
+    transformer = _WORKER_TRANSFORMERS.get(transformer_cls)
+    if transformer is None:
+        transformer = _WORKER_TRANSFORMERS[transformer_cls] = transformer_cls()
+    return getattr(transformer, method_name)(item)
+
+
+def read_html_text(html_path: Path) -> str:
+    """Read a chapter file as UTF-8 text with universal newlines.
+
+    Same result as read_text(encoding="utf-8"), but the whole file is
+    decoded in one call instead of through the incremental text layer.
+    """
+
+    text = html_path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def write_markdown(destination: Path, markdown: str) -> None:
+    """Write Markdown as UTF-8."""
+
+    write_bytes(destination, markdown.encode("utf-8"))
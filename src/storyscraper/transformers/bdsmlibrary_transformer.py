@@ -4,9 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
-from .auto import Transformer as AutoTransformer
+from .auto import Transformer as AutoTransformer, write_markdown
 
 
 class Transformer(AutoTransformer):
@@ -22,7 +20,8 @@ class Transformer(AutoTransformer):
         progress_callback=None,
     ):
         base_root = Path(stories_root) if stories_root is not None else Path("stories")
-        story_dir = base_root / options.effective_slug()
+        slug_value = options.effective_slug()
+        story_dir = base_root / slug_value
         html_dir = story_dir / "html"
         markdown_dir = story_dir / "markdown"
         log_file = story_dir / "transform.log"
@@ -35,15 +34,17 @@ class Transformer(AutoTransformer):
         markdown_dir.mkdir(parents=True, exist_ok=True)
 
         generated = []
-        html_files = sorted(html_dir.glob("*.html"))
+        html_files = self._list_html_files(html_dir)
         total = len(html_files)
-        for index, html_path in enumerate(html_files, start=1):
-            destination = markdown_dir / f"{options.effective_slug()}-{index:03d}.md"
+        results = self._convert_in_parallel("_convert_file", html_files)
+        for index, (html_path, markdown) in enumerate(
+            zip(html_files, results), start=1
+        ):
+            destination = markdown_dir / f"{slug_value}-{index:03d}.md"
             try:
-                raw_bytes = html_path.read_bytes()
-                html_text = raw_bytes.decode(self.ENCODING, errors="replace")
-                markdown = self._convert_html_to_markdown(html_text)
-                destination.write_text(markdown, encoding="utf-8")
+                if isinstance(markdown, Exception):
+                    raise markdown
+                write_markdown(destination, markdown)
                 generated.append(destination)
                 if progress_callback:
                     progress_callback(index, total, destination, False)
@@ -52,8 +53,14 @@ class Transformer(AutoTransformer):
 
         return generated
 
+    def _convert_file(self, html_path: Path) -> str:
+        raw_bytes = html_path.read_bytes()
+        return self._convert_html_to_markdown(
+            raw_bytes.decode(self.ENCODING, errors="replace")
+        )
+
     def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html)
         pre = soup.find("pre")
         if pre is None:
             return super()._convert_html_to_markdown(html)
@@ -4,24 +4,133 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from html import unescape as html_unescape
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import Iterable
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
-from .auto import Transformer as AutoTransformer
+from .auto import (
+    Transformer as AutoTransformer,
+    load_json,
+    read_html_text,
+    write_markdown,
+)
 from ..options import StoryScraperOptions
 
 
+class _ScanComplete(Exception):
+    """Raised by _MetadataScanner to stop parsing once it has what it needs."""
+
+
+class _MetadataScanner(HTMLParser):
+    """Collect the og:title without building a document tree."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.og_title: str | None = None
+        self._og_title_seen = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "meta" and not self._og_title_seen:
+            values = dict(attrs)
+            if values.get("property") == "og:title":
+                self._og_title_seen = True
+                self.og_title = values.get("content")
+                raise _ScanComplete
+
+
+@dataclass(slots=True)
+class _HtmlDocument:
+    """A chapter file read once and shared by sorting, conversion and metadata."""
+
+    path: Path
+    html: str | None
+    initial_state: dict[str, object] | None = None
+    published: datetime | None = None
+    error: Exception | None = None
+
+
 class Transformer(AutoTransformer):
     """Prefer DeviantArt deviation body/description containers."""
 
-    _CONTENT_SELECTORS = (
-        "[data-hook='deviation_body']",
-        "[data-hook='deviation_description']",
-        "[data-hook='deviation_content']",
+    # In order of preference when candidates tie on text length.
+    _CONTENT_HOOKS = (
+        "deviation_body",
+        "deviation_description",
+        "deviation_content",
+    )
+    # Compiled once here rather than on every select() call.
+    _CONTENT_SELECTOR = soupsieve.compile(
+        ", ".join(f"[data-hook='{hook}']" for hook in _CONTENT_HOOKS)
     )
-    _OG_TITLE_SELECTOR = "meta[property='og:title']"
+    _OG_TITLE_SELECTOR = soupsieve.compile("meta[property='og:title']")
+    # The conversion soup only needs the og:title meta and the literature
+    # <section>; everything else (notably the huge state script) is skipped.
+    _CONVERSION_STRAINER = SoupStrainer(["meta", "section"])
+    _INITIAL_STATE_START_RE = re.compile(
+        r'window\.__INITIAL_STATE__\s*=\s*JSON\.parse\("'
+    )
+    _INITIAL_STATE_RE = re.compile(
+        r'window\.__INITIAL_STATE__\s*=\s*JSON\.parse\("(.*?)"\);', re.DOTALL
+    )
+    _JS_STRING_DECODER = json.JSONDecoder(strict=False)
+    _JS_ESCAPE_RE = re.compile(r"\\(?:u(.{4})|(.)|\Z)", re.DOTALL)
+    _JS_SIMPLE_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f"}
+    # (metadata.json key, initial-state key) pairs copied when present.
+    _DEVIATION_METADATA_FIELDS: tuple[tuple[str, str], ...] = (
+        ("published_time", "publishedTime"),
+        ("mature_level", "matureLevel"),
+        ("is_mature", "isMature"),
+        ("is_nsfg", "isNsfg"),
+        ("is_commentable", "isCommentable"),
+        ("is_deleted", "isDeleted"),
+        ("is_published", "isPublished"),
+        ("is_downloadable", "isDownloadable"),
+        ("is_favouritable", "isFavouritable"),
+        ("is_ai_generated", "isAiGenerated"),
+        ("is_ai_use_disallowed", "isAiUseDisallowed"),
+        ("license", "license"),
+        ("short_url", "shortUrl"),
+        ("url", "url"),
+        ("text_content", "textContent"),
+        ("media", "media"),
+        ("is_adoptable", "isAdoptable"),
+        ("is_shareable", "isShareable"),
+        ("is_text_editable", "isTextEditable"),
+        ("is_background_editable", "isBackgroundEditable"),
+        ("is_upscaled", "isUpscaled"),
+        ("is_video", "isVideo"),
+        ("is_journal", "isJournal"),
+        ("is_purchasable", "isPurchasable"),
+        ("is_default_image", "isDefaultImage"),
+        ("is_antisocial", "isAntisocial"),
+        ("is_blocked", "isBlocked"),
+        ("can_update_ai_claim", "canUpdateAiClaim"),
+        ("has_private_comments", "hasPrivateComments"),
+        ("is_daily_deviation", "isDailyDeviation"),
+        ("is_dreamsofart", "isDreamsofart"),
+    )
+    _EXTENDED_METADATA_FIELDS: tuple[tuple[str, str], ...] = (
+        ("description_text", "descriptionText"),
+        ("deviation_uuid", "deviationUuid"),
+        ("group_list_url", "groupListUrl"),
+        ("parent_deviation_entity_id", "parentDeviationEntityId"),
+        ("can_user_add_to_group", "canUserAddToGroup"),
+        ("extended_stats", "stats"),
+    )
+    # Fast path for the fallback tags: quoted values of earlier attributes
+    # are skipped whole, so a ">" inside them does not end the tag.
+    _TAG_NAME_RE = re.compile(
+        r"""<a\s(?:[^>"']|"[^"]*"|'[^']*')*?(?<=[\s"'])data-tagname\s*=\s*"""
+        r"""(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`\\]+))""",
+        re.IGNORECASE,
+    )
+    _TAG_ANCHOR_STRAINER = SoupStrainer("a", attrs={"data-tagname": True})
 
     def transform_phase(
         self,
@@ -31,7 +140,8 @@ class Transformer(AutoTransformer):
         progress_callback=None,
     ) -> list[Path]:  # type: ignore[override]
         base_root = Path(stories_root) if stories_root is not None else Path("stories")
-        story_dir = base_root / options.effective_slug()
+        slug_value = options.effective_slug()
+        story_dir = base_root / slug_value
         html_dir = story_dir / "html"
         markdown_dir = story_dir / "markdown"
         log_file = story_dir / "transform.log"
@@ -43,30 +153,57 @@ class Transformer(AutoTransformer):
 
         markdown_dir.mkdir(parents=True, exist_ok=True)
 
-        html_files = sorted(html_dir.glob("*.html"))
-        ordered_files = self._sort_html_files_by_publish_date(html_files)
+        html_files = self._list_html_files(html_dir)
+        documents = [self._load_document(html_path) for html_path in html_files]
+        ordered_documents = self._sort_documents_by_publish_date(documents)
 
         generated: list[Path] = []
-        total = len(ordered_files)
-        for index, html_path in enumerate(ordered_files, start=1):
-            destination = markdown_dir / f"{options.effective_slug()}-{index:03d}.md"
+        total = len(ordered_documents)
+        results = self._convert_in_parallel("_convert_document", ordered_documents)
+        for index, (document, markdown) in enumerate(
+            zip(ordered_documents, results), start=1
+        ):
+            destination = markdown_dir / f"{slug_value}-{index:03d}.md"
             try:
-                html_text = html_path.read_text(encoding="utf-8")
-                markdown = self._convert_html_to_markdown(html_text)
-                destination.write_text(markdown, encoding="utf-8")
+                if isinstance(markdown, Exception):
+                    raise markdown
+                write_markdown(destination, markdown)
                 generated.append(destination)
                 if progress_callback:
                     progress_callback(index, total, destination, False)
             except Exception as exc:  # pragma: no cover - logged for later review
-                self._log_failure(log_file, html_path, exc)
+                self._log_failure(log_file, document.path, exc)
 
-        self._write_metadata(options, stories_root=stories_root)
+        self._write_metadata(story_dir, documents)
         return generated
 
+    def _load_document(self, html_path: Path) -> _HtmlDocument:
+        try:
+            html = read_html_text(html_path)
+        except (OSError, UnicodeDecodeError) as exc:
+            return _HtmlDocument(path=html_path, html=None, error=exc)
+        initial_state = self._extract_initial_state(html)
+        return _HtmlDocument(
+            path=html_path,
+            html=html,
+            initial_state=initial_state,
+            published=self._extract_publish_time(initial_state),
+        )
+
+    def _convert_document(self, document: _HtmlDocument) -> str:
+        if document.html is None:
+            raise document.error or ValueError("Unreadable HTML file")
+        return self._convert_html_to_markdown(
+            document.html, initial_state=document.initial_state
+        )
+
     def extract_content_root(self, soup: BeautifulSoup) -> Tag:
-        candidates: list[Tag] = []
-        for selector in self._CONTENT_SELECTORS:
-            candidates.extend(soup.select(selector))
+        # One traversal for all hooks, then grouped by hook as separate
+        # per-selector queries would have returned them.
+        candidates = sorted(
+            self._CONTENT_SELECTOR.select(soup),
+            key=lambda element: self._CONTENT_HOOKS.index(element.get("data-hook")),
+        )
 
         preferred = self._pick_largest_text(candidates)
         if preferred is not None:
@@ -74,23 +211,28 @@ class Transformer(AutoTransformer):
 
         return super().extract_content_root(soup)
 
-    def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+    def _convert_html_to_markdown(
+        self,
+        html: str,
+        *,
+        initial_state: dict[str, object] | None = None,
+    ) -> str:
+        soup = self._make_soup(html, parse_only=self._CONVERSION_STRAINER)
         title = self._extract_title_from_og(soup)
         literature_section = self._extract_literature_div(soup)
         if literature_section is not None:
             if self._is_unavailable_content(literature_section):
-                rendered = self._render_tiptap_markup(html)
+                rendered = self._render_tiptap_markup(html, initial_state)
                 if rendered:
                     body_markdown = super()._convert_html_to_markdown(rendered)
                     if title:
                         return f"# {title}\n\n{body_markdown.lstrip()}"
                     return body_markdown
-            body_markdown = super()._convert_html_to_markdown(str(literature_section))
+            body_markdown = self._convert_fragment_to_markdown(literature_section)
             if title:
                 return f"# {title}\n\n{body_markdown.lstrip()}"
             return body_markdown
-        rendered = self._render_tiptap_markup(html)
+        rendered = self._render_tiptap_markup(html, initial_state)
         if rendered:
             body_markdown = super()._convert_html_to_markdown(rendered)
             if title:
@@ -102,8 +244,11 @@ class Transformer(AutoTransformer):
         text = section.get_text(strip=True)
         return text == "This content is unavailable."
 
-    def _render_tiptap_markup(self, html: str) -> str | None:
-        state = self._extract_initial_state(html)
+    def _render_tiptap_markup(
+        self, html: str, state: dict[str, object] | None = None
+    ) -> str | None:
+        if state is None:
+            state = self._extract_initial_state(html)
         if state is None:
             return None
         deviation_id = self._extract_current_deviation_id(state)
@@ -201,21 +346,22 @@ class Transformer(AutoTransformer):
             .replace('"', "&quot;")
         )
 
-    def _sort_html_files_by_publish_date(self, html_files: list[Path]) -> list[Path]:
-        def sort_key(path: Path) -> tuple[int, datetime, str]:
-            published = self._extract_publish_time(path)
+    def _sort_documents_by_publish_date(
+        self, documents: list[_HtmlDocument]
+    ) -> list[_HtmlDocument]:
+        def sort_key(document: _HtmlDocument) -> tuple[int, datetime, str]:
+            published = document.published
             if published is None:
-                return (1, datetime.max.replace(tzinfo=timezone.utc), path.name)
-            return (0, published, path.name)
+                return (
+                    1,
+                    datetime.max.replace(tzinfo=timezone.utc),
+                    document.path.name,
+                )
+            return (0, published, document.path.name)
 
-        return sorted(html_files, key=sort_key)
+        return sorted(documents, key=sort_key)
 
-    def _extract_publish_time(self, html_path: Path) -> datetime | None:
-        try:
-            html = html_path.read_text(encoding="utf-8")
-        except OSError:
-            return None
-        state = self._extract_initial_state(html)
+    def _extract_publish_time(self, state: dict[str, object] | None) -> datetime | None:
         if state is None:
             return None
         deviation_id = self._extract_current_deviation_id(state)
@@ -231,7 +377,7 @@ class Transformer(AutoTransformer):
             return None
 
     def _extract_title_from_og(self, soup: BeautifulSoup) -> str | None:
-        tag = soup.select_one(self._OG_TITLE_SELECTOR)
+        tag = self._OG_TITLE_SELECTOR.select_one(soup)
         if tag is None:
             return None
         content = tag.get("content")
@@ -251,36 +397,31 @@ class Transformer(AutoTransformer):
         return story_title.strip() or None, author.strip() or None
 
     def _extract_literature_div(self, soup: BeautifulSoup) -> Tag | None:
-        headings = soup.find_all("h2")
-        for heading in headings:
-            if heading.get_text(strip=True) != "Literature Text":
-                continue
-            section = heading.find_parent("section")
-            if section is None:
-                continue
-            content_div = section.find("div", recursive=False)
-            if content_div is not None:
-                return content_div
+        # Walk the headings lazily so the search stops at the first match
+        # instead of collecting every h2 in the page up front.
+        heading = soup.find("h2")
+        while heading is not None:
+            if heading.get_text(strip=True) == "Literature Text":
+                section = heading.find_parent("section")
+                if section is not None:
+                    content_div = section.find("div", recursive=False)
+                    if content_div is not None:
+                        return content_div
+            heading = heading.find_next("h2")
         return None
 
-    def _write_metadata(
-        self,
-        options: StoryScraperOptions,
-        *,
-        stories_root: Path | None = None,
-    ) -> None:
-        base_root = Path(stories_root) if stories_root is not None else Path("stories")
-        story_dir = base_root / options.effective_slug()
-        html_dir = story_dir / "html"
-        html_files = sorted(html_dir.glob("*.html"))
-        if not html_files:
+    def _write_metadata(self, story_dir: Path, documents: list[_HtmlDocument]) -> None:
+        if not documents:
             return
 
+        last_updated = datetime.now(timezone.utc).isoformat(timespec="seconds")
         metadata_by_id: dict[str, dict[str, object]] = {}
-        for html_file in html_files:
-            html_text = html_file.read_text(encoding="utf-8")
+        for document in documents:
+            if document.html is None:
+                continue
+            html_file = document.path
             title, author, tags, stats, badges, extra = self._extract_metadata(
-                html_text
+                document.html, initial_state=document.initial_state
             )
             deviation_id = extra.get("deviation_id")
             if not isinstance(deviation_id, str) or not deviation_id:
@@ -291,9 +432,7 @@ class Transformer(AutoTransformer):
                 "tags": tags,
                 "title": title,
                 "author": author,
-                "last_updated": datetime.now(timezone.utc).isoformat(
-                    timespec="seconds"
-                ),
+                "last_updated": last_updated,
             }
             if stats is not None:
                 payload["favorites"] = stats.get("favorites")
@@ -305,13 +444,22 @@ class Transformer(AutoTransformer):
                 payload.update(extra)
             metadata_by_id[deviation_id] = payload
         destination = story_dir / "metadata.json"
-        destination.write_text(
-            json.dumps(metadata_by_id, ensure_ascii=True, indent=2) + "\n",
-            encoding="utf-8",
-        )
+        # Entries stay buffered so a repeated deviation id keeps its first
+        # position with the last payload, but the serialized text is streamed
+        # to the file instead of being built as one string. Non-ASCII text is
+        # written as UTF-8; a lone surrogate from the page state cannot be
+        # encoded and comes out as its \uXXXX escape, which is still valid JSON.
+        with destination.open(
+            "w", encoding="utf-8", errors="backslashreplace"
+        ) as handle:
+            json.dump(metadata_by_id, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
 
     def _extract_metadata(
-        self, html: str
+        self,
+        html: str,
+        *,
+        initial_state: dict[str, object] | None = None,
     ) -> tuple[
         str | None,
         str | None,
@@ -320,24 +468,19 @@ class Transformer(AutoTransformer):
         dict[str, int] | None,
         dict[str, object],
     ]:
-        soup = BeautifulSoup(html, "html.parser")
         title: str | None = None
         author: str | None = None
-        og_tag = soup.select_one(self._OG_TITLE_SELECTOR)
-        if og_tag is not None:
-            content = og_tag.get("content")
-            if isinstance(content, str):
-                title, author = self._split_title_author(content.strip())
-
         tags: list[str] = []
         stats: dict[str, int] | None = None
         badges: dict[str, int] | None = None
         extra: dict[str, object] = {}
 
-        initial_state = self._extract_initial_state(html)
+        if initial_state is None:
+            initial_state = self._extract_initial_state(html)
         if initial_state is not None:
             deviation_id = self._extract_current_deviation_id(initial_state)
-            deviation = self._extract_deviation(initial_state, deviation_id)
+            entities = self._state_entities(initial_state)
+            deviation = self._lookup_entity(entities, "deviation", deviation_id)
             if deviation is not None:
                 state_title = deviation.get("title")
                 if isinstance(state_title, str) and state_title.strip():
@@ -350,7 +493,7 @@ class Transformer(AutoTransformer):
                 stats = self._extract_stats_from_deviation(deviation)
                 extra.update(self._extract_deviation_metadata(deviation))
 
-            extended = self._extract_deviation_extended(initial_state, deviation_id)
+            extended = self._lookup_entity(entities, "deviationExtended", deviation_id)
             if extended is not None:
                 state_tags = self._extract_tags_from_extended(extended)
                 if state_tags:
@@ -360,25 +503,47 @@ class Transformer(AutoTransformer):
             if deviation_id is not None:
                 extra["deviation_id"] = deviation_id
 
+        # The og:title scan walks the whole page, so it only runs when the
+        # state did not already supply both the title and the author.
+        if title is None or author is None:
+            og_title = self._scan_metadata(html).og_title
+            if og_title is not None:
+                og_story_title, og_author = self._split_title_author(og_title.strip())
+                title = title or og_story_title
+                author = author or og_author
+
         if not tags:
             tags = self._extract_tags(html)
 
         return title, author, tags, stats, badges, extra
 
+    def _scan_metadata(self, html: str) -> _MetadataScanner:
+        scanner = _MetadataScanner()
+        try:
+            scanner.feed(html)
+            scanner.close()
+        except _ScanComplete:
+            pass
+        return scanner
+
     def _extract_initial_state(self, html: str) -> dict[str, object] | None:
-        match = re.search(
-            r'window\.__INITIAL_STATE__\s*=\s*JSON\.parse\("(.*?)"\);',
-            html,
-            re.DOTALL,
-        )
+        match = self._INITIAL_STATE_START_RE.search(html)
         if match is None:
             return None
-        raw = match.group(1)
-        decoded = self._unescape_js_string(raw)
-        if decoded is None:
+        decoded: str | None
+        try:
+            # The JS string literal is (almost always) a valid JSON string, so
+            # the C decoder can unescape it and find its end in one pass.
+            decoded, _ = self._JS_STRING_DECODER.raw_decode(html, match.end() - 1)
+        except json.JSONDecodeError:
+            fallback = self._INITIAL_STATE_RE.match(html, match.start())
+            if fallback is None:
+                return None
+            decoded = self._unescape_js_string(fallback.group(1))
+        if not isinstance(decoded, str):
             return None
         try:
-            parsed = json.loads(decoded)
+            parsed = load_json(decoded)
         except json.JSONDecodeError:
             return None
         if isinstance(parsed, dict):
@@ -386,95 +551,60 @@ class Transformer(AutoTransformer):
         return None
 
     def _unescape_js_string(self, value: str) -> str | None:
-        output: list[str] = []
-        i = 0
-        length = len(value)
-        while i < length:
-            ch = value[i]
-            if ch != "\\":
-                output.append(ch)
-                i += 1
-                continue
-            i += 1
-            if i >= length:
-                return None
-            esc = value[i]
-            if esc == "u":
-                if i + 4 >= length:
-                    return None
-                hex_value = value[i + 1 : i + 5]
-                try:
-                    output.append(chr(int(hex_value, 16)))
-                except ValueError:
-                    return None
-                i += 5
-                continue
-            if esc == "n":
-                output.append("\n")
-            elif esc == "r":
-                output.append("\r")
-            elif esc == "t":
-                output.append("\t")
-            elif esc == "b":
-                output.append("\b")
-            elif esc == "f":
-                output.append("\f")
-            elif esc == '"':
-                output.append('"')
-            elif esc == "'":
-                output.append("'")
-            elif esc == "/":
-                output.append("/")
-            elif esc == "\\":
-                output.append("\\")
-            else:
-                output.append(esc)
-            i += 1
-        return "".join(output)
+        try:
+            return self._JS_ESCAPE_RE.sub(self._replace_js_escape, value)
+        except ValueError:
+            return None
+
+    def _replace_js_escape(self, match: re.Match[str]) -> str:
+        hex_value, esc = match.groups()
+        if hex_value is not None:
+            return chr(int(hex_value, 16))
+        if esc is None or esc == "u":
+            # Trailing backslash or a truncated \u escape.
+            raise ValueError("Malformed JavaScript string escape")
+        return self._JS_SIMPLE_ESCAPES.get(esc, esc)
 
     def _extract_current_deviation_id(self, state: dict[str, object]) -> str | None:
-        duperbrowse = state.get("@@DUPERBROWSE")
-        if isinstance(duperbrowse, dict):
-            root_stream = duperbrowse.get("rootStream")
-            if isinstance(root_stream, dict):
-                current_open = root_stream.get("currentOpenItem")
-                if isinstance(current_open, (int, str)):
-                    return str(current_open)
+        try:
+            root_stream = state["@@DUPERBROWSE"]["rootStream"]  # type: ignore[index]
+            current_open = root_stream["currentOpenItem"]
+        except (KeyError, TypeError):
+            return None
+        if isinstance(current_open, (int, str)):
+            return str(current_open)
         return None
 
     def _extract_deviation(
         self, state: dict[str, object], deviation_id: str | None
     ) -> dict[str, object] | None:
+        return self._lookup_entity(
+            self._state_entities(state), "deviation", deviation_id
+        )
+
+    def _state_entities(self, state: dict[str, object]) -> dict[str, object] | None:
         entities = state.get("@@entities")
-        if not isinstance(entities, dict):
-            return None
-        deviations = entities.get("deviation")
-        if isinstance(deviations, dict):
-            if deviation_id and deviation_id in deviations:
-                deviation = deviations.get(deviation_id)
-                if isinstance(deviation, dict):
-                    return deviation
-            for deviation in deviations.values():
-                if isinstance(deviation, dict):
-                    return deviation
-        return None
+        return entities if isinstance(entities, dict) else None
 
-    def _extract_deviation_extended(
-        self, state: dict[str, object], deviation_id: str | None
+    def _lookup_entity(
+        self,
+        entities: dict[str, object] | None,
+        collection: str,
+        deviation_id: str | None,
     ) -> dict[str, object] | None:
-        entities = state.get("@@entities")
-        if not isinstance(entities, dict):
+        if entities is None:
             return None
-        extended = entities.get("deviationExtended")
-        if isinstance(extended, dict):
-            if deviation_id and deviation_id in extended:
-                deviation = extended.get(deviation_id)
-                if isinstance(deviation, dict):
-                    return deviation
-            for deviation in extended.values():
-                if isinstance(deviation, dict):
-                    return deviation
-        return None
+        entries = entities.get(collection)
+        if not isinstance(entries, dict):
+            return None
+        # With a known id, only that entry will do; another deviation's data
+        # would be attributed to the wrong story.
+        if deviation_id:
+            entry = entries.get(deviation_id)
+            return entry if isinstance(entry, dict) else None
+        return next(
+            (entry for entry in entries.values() if isinstance(entry, dict)), None
+        )
 
     def _extract_stats_from_deviation(
         self, deviation: dict[str, object]
@@ -500,66 +630,31 @@ class Transformer(AutoTransformer):
     def _extract_deviation_metadata(
         self, deviation: dict[str, object]
     ) -> dict[str, object]:
-        fields = {
-            "published_time": deviation.get("publishedTime"),
-            "mature_level": deviation.get("matureLevel"),
-            "is_mature": deviation.get("isMature"),
-            "is_nsfg": deviation.get("isNsfg"),
-            "is_commentable": deviation.get("isCommentable"),
-            "is_deleted": deviation.get("isDeleted"),
-            "is_published": deviation.get("isPublished"),
-            "is_downloadable": deviation.get("isDownloadable"),
-            "is_favouritable": deviation.get("isFavouritable"),
-            "is_ai_generated": deviation.get("isAiGenerated"),
-            "is_ai_use_disallowed": deviation.get("isAiUseDisallowed"),
-            "license": deviation.get("license"),
-            "short_url": deviation.get("shortUrl"),
-            "url": deviation.get("url"),
-            "text_content": deviation.get("textContent"),
-            "media": deviation.get("media"),
-            "is_adoptable": deviation.get("isAdoptable"),
-            "is_shareable": deviation.get("isShareable"),
-            "is_text_editable": deviation.get("isTextEditable"),
-            "is_background_editable": deviation.get("isBackgroundEditable"),
-            "is_upscaled": deviation.get("isUpscaled"),
-            "is_video": deviation.get("isVideo"),
-            "is_journal": deviation.get("isJournal"),
-            "is_purchasable": deviation.get("isPurchasable"),
-            "is_default_image": deviation.get("isDefaultImage"),
-            "is_antisocial": deviation.get("isAntisocial"),
-            "is_blocked": deviation.get("isBlocked"),
-            "can_update_ai_claim": deviation.get("canUpdateAiClaim"),
-            "has_private_comments": deviation.get("hasPrivateComments"),
-            "is_daily_deviation": deviation.get("isDailyDeviation"),
-            "is_dreamsofart": deviation.get("isDreamsofart"),
-        }
-        return {key: value for key, value in fields.items() if value is not None}
+        return self._pick_fields(deviation, self._DEVIATION_METADATA_FIELDS)
 
     def _extract_extended_metadata(
         self, extended: dict[str, object]
     ) -> dict[str, object]:
-        fields = {
-            "description_text": extended.get("descriptionText"),
-            "deviation_uuid": extended.get("deviationUuid"),
-            "group_list_url": extended.get("groupListUrl"),
-            "parent_deviation_entity_id": extended.get("parentDeviationEntityId"),
-            "can_user_add_to_group": extended.get("canUserAddToGroup"),
-            "extended_stats": extended.get("stats"),
+        return self._pick_fields(extended, self._EXTENDED_METADATA_FIELDS)
+
+    def _pick_fields(
+        self, source: dict[str, object], fields: tuple[tuple[str, str], ...]
+    ) -> dict[str, object]:
+        return {
+            key: value
+            for key, source_key in fields
+            if (value := source.get(source_key)) is not None
         }
-        return {key: value for key, value in fields.items() if value is not None}
 
     def _extract_tags_from_extended(self, extended: dict[str, object]) -> list[str]:
-        tags: list[str] = []
         raw_tags = extended.get("tags")
-        if isinstance(raw_tags, list):
-            for item in raw_tags:
-                if isinstance(item, dict):
-                    name = item.get("name")
-                    if isinstance(name, str):
-                        tag = name.strip()
-                        if tag and tag not in tags:
-                            tags.append(tag)
-        return tags
+        if not isinstance(raw_tags, list):
+            return []
+        return self._dedupe_tags(
+            name
+            for item in raw_tags
+            if isinstance(item, dict) and isinstance(name := item.get("name"), str)
+        )
 
     def _extract_badges_from_extended(
         self, extended: dict[str, object]
@@ -584,13 +679,22 @@ class Transformer(AutoTransformer):
         return badges
 
     def _extract_tags(self, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        tags: list[str] = []
-        for anchor in soup.select("a[data-tagname]"):
-            value = anchor.get("data-tagname")
-            if not isinstance(value, str):
-                continue
-            value = value.strip()
-            if value and value not in tags:
-                tags.append(value)
-        return tags
+        tags = self._dedupe_tags(
+            html_unescape(next(value for value in match.groups() if value is not None))
+            for match in self._TAG_NAME_RE.finditer(html)
+        )
+        if tags:
+            return tags
+        # Markup the regex cannot follow still gets a real parse of the tag
+        # anchors before the page is declared tagless.
+        soup = self._make_soup(html, parse_only=self._TAG_ANCHOR_STRAINER)
+        return self._dedupe_tags(
+            value
+            for anchor in soup.find_all("a")
+            if isinstance(value := anchor.get("data-tagname"), str)
+        )
+
+    def _dedupe_tags(self, values: Iterable[str]) -> list[str]:
+        # dict.fromkeys keeps first-seen order with constant-time membership.
+        stripped = (value.strip() for value in values)
+        return list(dict.fromkeys(value for value in stripped if value))
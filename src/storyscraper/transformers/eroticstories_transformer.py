@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import re
+
 from bs4 import BeautifulSoup, NavigableString, Tag
-from markdownify import markdownify as html_to_markdown
 
-from .auto import Transformer as AutoTransformer
+from .auto import MARKDOWN_CONVERTER, Transformer as AutoTransformer
 
 
 class Transformer(AutoTransformer):
@@ -23,6 +24,8 @@ class Transformer(AutoTransformer):
         "do you like this story",
         "request from webmaster",
     )
+    _HEADER_MARKER_RE = re.compile("|".join(map(re.escape, _HEADER_MARKERS)))
+    _SEGMENT_END_MARKER_RE = re.compile("|".join(map(re.escape, _SEGMENT_END_MARKERS)))
 
     def _convert_html_to_markdown(self, html: str) -> str:
         soup = BeautifulSoup(html, "html5lib")
@@ -48,23 +51,26 @@ class Transformer(AutoTransformer):
         if not cleaned_segments:
             return super()._convert_html_to_markdown(html)
 
-        combined = BeautifulSoup("", "html.parser").new_tag("div")
-        for cleaned in cleaned_segments:
-            combined.append(cleaned)
-
-        return html_to_markdown(str(combined))
+        # Each segment is converted in place and on its own; the join puts
+        # back the blank line a shared wrapper would have left between them.
+        return "\n\n".join(
+            MARKDOWN_CONVERTER.convert_soup(cleaned).strip("\n")
+            for cleaned in cleaned_segments
+        )
 
     def _extract_segment(self, segment: Tag, *, is_first: bool) -> Tag | None:
         blocks = self._segment_blocks(segment)
         if not blocks:
             return None
 
-        header_end = self._header_end_index(blocks)
+        # Both scans below look at the same blocks, so walk each subtree once.
+        block_texts = [block.get_text(" ", strip=True).lower() for block in blocks]
+        header_end = self._header_end_index(block_texts)
         if header_end < 0:
             header_end = -1
         start = header_end + 1
 
-        end = self._segment_end_index(blocks, is_first=is_first)
+        end = self._segment_end_index(block_texts, is_first=is_first)
         if end < 0:
             end = len(blocks)
 
@@ -90,28 +96,34 @@ class Transformer(AutoTransformer):
             if not isinstance(child, Tag):
                 continue
             if child.name in self._BLOCK_TAGS:
-                if child.get_text(" ", strip=True):
+                if self._has_text(child):
                     blocks.append(child)
                 continue
-            descendant_blocks = [
+            blocks.extend(
                 block
                 for block in child.find_all(self._BLOCK_TAGS, recursive=True)
-                if block.get_text(" ", strip=True)
-            ]
-            blocks.extend(descendant_blocks)
+                if self._has_text(block)
+            )
         return blocks
 
-    def _header_end_index(self, blocks: list[Tag]) -> int:
+    def _has_text(self, block: Tag) -> bool:
+        # Same test as a non-empty get_text(" ", strip=True), but it stops at
+        # the first visible string instead of joining the whole subtree.
+        return next(block.stripped_strings, None) is not None
+
+    def _header_end_index(self, block_texts: list[str]) -> int:
         last_marker = -1
-        for index, block in enumerate(blocks[:12]):
-            text = block.get_text(" ", strip=True).lower()
-            if any(marker in text for marker in self._HEADER_MARKERS):
+        for index, text in enumerate(block_texts[:12]):
+            if self._HEADER_MARKER_RE.search(text):
                 last_marker = index
         return last_marker
 
-    def _segment_end_index(self, blocks: list[Tag], *, is_first: bool) -> int:
-        for index, block in enumerate(blocks):
-            text = block.get_text(" ", strip=True).lower()
+    def _segment_end_index(self, block_texts: list[str], *, is_first: bool) -> int:
+        for index, text in enumerate(block_texts):
+            # One pass rules out the common block; the checks below only
+            # decide which marker wins when a block mentions several.
+            if not self._SEGMENT_END_MARKER_RE.search(text):
+                continue
             if "click here to read the rest of this story" in text:
                 return index if is_first else -1
             if "do you like this story" in text:
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as html_to_markdown
+import soupsieve
+from bs4 import SoupStrainer
 
-from .auto import Transformer as AutoTransformer
+from .auto import MARKDOWN_CONVERTER, Transformer as AutoTransformer
 
 
 class Transformer(AutoTransformer):
     """Convert FanFiction.Net story text into Markdown."""
 
-    _CONTENT_SELECTOR = "#storytext, .storytext"
+    _CONTENT_SELECTOR = soupsieve.compile("#storytext, .storytext")
+    # FanFiction.Net's story div carries the id, so only that subtree is
+    # built; pages that only use the class get a full parse below.
+    _CONTENT_STRAINER = SoupStrainer("div", id="storytext")
 
     def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        content = soup.select_one(self._CONTENT_SELECTOR)
+        soup = self._make_soup(html, parse_only=self._CONTENT_STRAINER)
+        content = self._CONTENT_SELECTOR.select_one(soup)
         if content is None:
-            return super()._convert_html_to_markdown(html)
+            soup = self._make_soup(html)
+            content = self._CONTENT_SELECTOR.select_one(soup)
+        if content is None:
+            return self._convert_soup_to_markdown(soup)
 
         heading_tag = content.find("strong")
         heading_text = None
@@ -25,7 +31,11 @@ class Transformer(AutoTransformer):
             heading_text = heading_tag.get_text(strip=True)
             heading_tag.decompose()
 
-        markdown = html_to_markdown(str(content))
+        # Converted in place, as serializing the div for markdownify would
+        # only have it parse the same markup again.
+        document = self._make_soup("")
+        document.append(content.extract())
+        markdown = MARKDOWN_CONVERTER.convert_soup(document)
         if heading_text:
             return f"# {heading_text}\n\n{markdown.lstrip()}"
 
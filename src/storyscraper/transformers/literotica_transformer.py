@@ -5,17 +5,28 @@ from __future__ import annotations
 import codecs
 import json
 import re
-from typing import Any
+from typing import Any, Iterable
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
-from .auto import Transformer as AutoTransformer
+from .auto import Transformer as AutoTransformer, load_json
 
 
 class Transformer(AutoTransformer):
     """Convert Literotica stories by decoding their inline pageText strings."""
 
     _PAGETEXT_RE = re.compile(r'pageText:"((?:\\.|[^"\\])*)"')
+    _TILDE_FENCE_RE = re.compile(r"^[ \t]*~{3,}[ \t]*$", re.MULTILINE)
+    # Script bodies are raw text, so the JSON-LD blocks can be sliced out of
+    # the page without building a document tree. Quoted attribute values
+    # are skipped whole, so a ">" inside them does not end the tag.
+    _LD_JSON_RE = re.compile(
+        r"""<script\s(?:[^>"']|"[^"]*"|'[^']*')*?(?<=[\s"'])type\s*=\s*"""
+        r"""(?:"application/ld\+json"|'application/ld\+json'|application/ld\+json(?=[\s/>]))"""
+        r"""(?:[^>"']|"[^"]*"|'[^']*')*>(.*?)</script""",
+        re.IGNORECASE | re.DOTALL,
+    )
+    _LD_JSON_STRAINER = SoupStrainer("script", attrs={"type": "application/ld+json"})
 
     def _convert_html_to_markdown(self, html: str) -> str:
         segments = self._extract_page_texts(html)
@@ -38,11 +49,10 @@ class Transformer(AutoTransformer):
         return headline or None
 
     def _extract_page_texts(self, html: str) -> list[str]:
-        matches = self._PAGETEXT_RE.findall(html)
         texts: list[str] = []
-        for raw in matches:
+        for match in self._PAGETEXT_RE.finditer(html):
             try:
-                decoded = codecs.decode(raw, "unicode_escape")
+                decoded = self._decode_page_text(match.group(1))
             except Exception:
                 continue
             decoded = decoded.replace("\r\n", "\n").replace("\r", "\n").strip()
@@ -51,16 +61,34 @@ class Transformer(AutoTransformer):
                 texts.append(decoded)
         return texts
 
+    def _decode_page_text(self, raw: str) -> str:
+        """Unescape a captured pageText literal, keeping non-ASCII text intact."""
+
+        try:
+            # pageText is normally a JSON string body; the C scanner decodes it
+            # in one pass.
+            return json.loads(f'"{raw}"', strict=False)
+        except json.JSONDecodeError:
+            # JS-only escapes such as \' or \x41: escape the non-ASCII text
+            # first so unicode_escape does not read it as Latin-1 bytes.
+            return codecs.decode(
+                raw.encode("ascii", "backslashreplace"), "unicode_escape"
+            )
+
     def _sanitize_markdown(self, text: str) -> str:
         """Replace fence-like tilde lines with a Markdown HR to avoid code blocks."""
 
-        return re.sub(r"^[ \t]*~{3,}[ \t]*$", "---", text, flags=re.MULTILINE)
+        return self._TILDE_FENCE_RE.sub("---", text)
 
     def _extract_article_metadata(self, html: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
-        scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-        for script in scripts:
-            data = self._parse_ld_json(script.string)
+        script_texts: Iterable[str | None] = self._LD_JSON_RE.findall(html)
+        if not script_texts:
+            # Markup the regex cannot follow still gets a real parse of the
+            # script tags before the page is declared to have no metadata.
+            soup = self._make_soup(html, parse_only=self._LD_JSON_STRAINER)
+            script_texts = [script.string for script in soup.find_all("script")]
+        for script_text in script_texts:
+            data = self._parse_ld_json(script_text)
             if not data:
                 continue
             if isinstance(data, list):
@@ -78,7 +106,7 @@ class Transformer(AutoTransformer):
         if not text:
             return None
         try:
-            return json.loads(text)
+            return load_json(text)
         except json.JSONDecodeError:
             return None
 
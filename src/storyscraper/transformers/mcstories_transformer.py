@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 
 from .auto import Transformer as AutoTransformer
@@ -10,30 +11,42 @@ from .auto import Transformer as AutoTransformer
 class Transformer(AutoTransformer):
     """Adjust MCStories HTML before running the default transformer."""
 
+    _NORMALIZE_SELECTOR = soupsieve.compile(
+        "h3.title, h3.trailer, span.milestone, section.foreword"
+    )
+
     def extract_content_root(self, soup: BeautifulSoup) -> Tag:
         self._normalize_document(soup)
         return super().extract_content_root(soup)
 
     def _normalize_document(self, soup: BeautifulSoup) -> None:
-        self._promote_titles(soup)
-        self._remove_trailers(soup)
-        self._convert_milestones(soup)
-        self._italicize_foreword(soup)
-
-    def _promote_titles(self, soup: BeautifulSoup) -> None:
-        for title in soup.select("h3.title"):
-            title.name = "h1"
-
-    def _remove_trailers(self, soup: BeautifulSoup) -> None:
-        for trailer in soup.select("h3.trailer"):
-            trailer.decompose()
-
-    def _convert_milestones(self, soup: BeautifulSoup) -> None:
-        for milestone in soup.select("span.milestone"):
-            milestone.name = "hr"
-            milestone.attrs.clear()
-            milestone.string = ""
-
-    def _italicize_foreword(self, soup: BeautifulSoup) -> None:
-        for foreword in soup.select("section.foreword"):
-            foreword.name = "em"
+        # One traversal for all four rewrites. Elements inside a trailer that
+        # was already decomposed are skipped, as the old per-selector passes
+        # never saw them.
+        for element in self._NORMALIZE_SELECTOR.select(soup):
+            if element.decomposed:
+                continue
+            classes = element.get_attribute_list("class")
+            if element.name == "h3":
+                if "title" in classes:
+                    self._promote_title(element)
+                else:
+                    self._remove_trailer(element)
+            elif element.name == "span":
+                self._convert_milestone(element)
+            else:
+                self._italicize_foreword(element)
+
+    def _promote_title(self, title: Tag) -> None:
+        title.name = "h1"
+
+    def _remove_trailer(self, trailer: Tag) -> None:
+        trailer.decompose()
+
+    def _convert_milestone(self, milestone: Tag) -> None:
+        milestone.name = "hr"
+        milestone.attrs.clear()
+        milestone.string = ""
+
+    def _italicize_foreword(self, foreword: Tag) -> None:
+        foreword.name = "em"
@@ -6,18 +6,30 @@ import json
 import re
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
-from .auto import Transformer as AutoTransformer
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .auto import (
+    Transformer as AutoTransformer,
+    load_json,
+    read_html_text,
+    write_markdown,
+)
 from ..options import StoryScraperOptions, slugify
 
 
 class Transformer(AutoTransformer):
     """Extract post HTML from the embedded Next.js state and convert to Markdown."""
 
-    _NEXT_DATA_RE = re.compile(
-        r'__NEXT_DATA__"?\s*type="application/json">(.*?)</script>', re.S
-    )
+    _NEXT_DATA_MARKER = "__NEXT_DATA__"
+    # What has to follow the marker for it to be the script tag's id.
+    _NEXT_DATA_TAG_RE = re.compile(r'"?\s*type="application/json">')
+    _CHAPTER_OR_PART_RE = re.compile(r"(chapter|part)\s*(\d+)", re.I)
+    _TILDE_FENCE_RE = re.compile(r"^[ \t]*~{3,}[ \t]*$", re.MULTILINE)
+    # ASCII-only case folding matches exactly what "in collection" in
+    # text.lower() did, without a Python callback per string.
+    _IN_COLLECTION_RE = re.compile("in collection", re.IGNORECASE | re.ASCII)
+    # The fallback title only needs <title>, not a tree of the whole page.
+    _TITLE_STRAINER = SoupStrainer("title")
 
     def transform_phase(
         self,
@@ -27,7 +39,8 @@ class Transformer(AutoTransformer):
         progress_callback=None,
     ) -> list[Path]:  # type: ignore[override]
         base_root = Path(stories_root) if stories_root is not None else Path("stories")
-        story_dir = base_root / options.effective_slug()
+        slug_value = options.effective_slug()
+        story_dir = base_root / slug_value
         html_dir = story_dir / "html"
         markdown_dir = story_dir / "markdown"
         log_file = story_dir / "transform.log"
@@ -40,17 +53,19 @@ class Transformer(AutoTransformer):
         markdown_dir.mkdir(parents=True, exist_ok=True)
 
         generated: list[Path] = []
-        html_files = sorted(html_dir.glob("*.html"))
+        html_files = self._list_html_files(html_dir)
         total = len(html_files)
-        for index, html_path in enumerate(html_files, start=1):
+        results = self._convert_in_parallel("_convert_file", html_files)
+        for index, (html_path, result) in enumerate(zip(html_files, results), start=1):
             try:
-                html_text = html_path.read_text(encoding="utf-8")
-                markdown = self._convert_html_to_markdown(html_text)
-                basename = self._derive_basename(
-                    html_text, index, options.effective_slug()
+                if isinstance(result, Exception):
+                    raise result
+                markdown, name_title = result
+                basename = self._derive_basename_from_title(
+                    name_title, index, slug_value
                 )
                 destination = markdown_dir / f"{basename}.md"
-                destination.write_text(markdown, encoding="utf-8")
+                write_markdown(destination, markdown)
                 generated.append(destination)
                 if progress_callback:
                     progress_callback(index, total, destination, False)
@@ -59,24 +74,47 @@ class Transformer(AutoTransformer):
 
         return generated
 
+    def _convert_file(self, html_path: Path) -> tuple[str, str | None]:
+        """Return the Markdown and the title to name the file after.
+
+        Runs in a worker process for larger stories, so all the parsing
+        happens here and only the numbering is left to the caller.
+        """
+
+        html_text = read_html_text(html_path)
+        # The post is pulled out of __NEXT_DATA__ once and shared by the
+        # conversion and the file name.
+        content, title = self._extract_content_and_title(html_text)
+        markdown = self._convert_extracted_to_markdown(html_text, content, title)
+        return markdown, title or self._extract_fallback_title(html_text)
+
     def _convert_html_to_markdown(self, html: str) -> str:
-        content_html, title = self._extract_content_and_title(html)
-        if content_html:
-            markdown = super()._convert_html_to_markdown(content_html)
+        content, title = self._extract_content_and_title(html)
+        return self._convert_extracted_to_markdown(html, content, title)
+
+    def _convert_extracted_to_markdown(
+        self, html: str, content: BeautifulSoup | None, title: str | None
+    ) -> str:
+        if content is not None and content.contents:
+            markdown = self._convert_soup_to_markdown(content)
             markdown = self._sanitize_markdown(markdown)
             if title:
                 return f"# {title}\n\n{markdown.lstrip()}"
             return markdown
         return super()._convert_html_to_markdown(html)
 
-    def _extract_content_and_title(self, html: str) -> tuple[str | None, str | None]:
-        match = self._NEXT_DATA_RE.search(html)
-        if not match:
+    def _extract_content_and_title(
+        self, html: str
+    ) -> tuple[BeautifulSoup | None, str | None]:
+        payload = self._next_data_payload(html)
+        if payload is None:
             return None, None
         try:
-            data = json.loads(match.group(1))
+            data = load_json(payload)
         except json.JSONDecodeError:
             return None, None
+        if not isinstance(data, dict):
+            return None, None
 
         page_props = data.get("props", {}).get("pageProps", {})
         post = (
@@ -95,32 +133,51 @@ class Transformer(AutoTransformer):
         title = attributes.get("title") if isinstance(attributes, dict) else None
 
         if isinstance(content_html, str):
-            soup = BeautifulSoup(content_html, "html.parser")
-            for marker in soup.find_all(
-                string=lambda s: isinstance(s, str) and "in collection" in s.lower()
-            ):
+            # The cleaned post is returned as a tree: serializing it here
+            # would only have the converter parse the same markup again.
+            content = self._make_soup(content_html)
+            for marker in content.find_all(string=self._IN_COLLECTION_RE):
                 parent = marker.parent
-                if parent:
+                # A marker outside any tag only takes itself with it;
+                # decomposing the whole document would empty the post.
+                if parent is content:
+                    marker.extract()
+                elif parent:
                     parent.decompose()
-            cleaned_html = str(soup)
-            return cleaned_html, title if isinstance(title, str) else None
+            return content, title if isinstance(title, str) else None
         return None, None
 
+    def _next_data_payload(self, html: str) -> str | None:
+        """Return the __NEXT_DATA__ script body, found with plain string scans.
+
+        A lazy regex capture would step through the (often very large) JSON
+        one character at a time looking for the closing tag.
+        """
+
+        position = 0
+        while (position := html.find(self._NEXT_DATA_MARKER, position)) >= 0:
+            position += len(self._NEXT_DATA_MARKER)
+            tag = self._NEXT_DATA_TAG_RE.match(html, position)
+            if tag is None:
+                continue
+            end = html.find("</script>", tag.end())
+            if end < 0:
+                return None
+            return html[tag.end() : end]
+        return None
+
     def _sanitize_markdown(self, html: str) -> str:
         """Replace fence-like tilde lines with a Markdown HR to avoid code blocks."""
 
-        return re.sub(r"^[ \t]*~{3,}[ \t]*$", "---", html, flags=re.MULTILINE)
+        return self._TILDE_FENCE_RE.sub("---", html)
 
-    def _derive_basename(self, html: str, index: int, slug_value: str) -> str:
-        _, title = self._extract_content_and_title(html)
-        if not title:
-            title = self._extract_fallback_title(html)
+    def _derive_basename_from_title(
+        self, title: str | None, index: int, slug_value: str
+    ) -> str:
         if not title:
             return f"{slug_value}-{index:03d}"
 
-        chapter = self._parse_number(title, r"chapter\s*(\d+)")
-        part = self._parse_number(title, r"part\s*(\d+)")
-        prefix_slug = self._prefix_slug(title)
+        chapter, part, prefix_slug = self._parse_title(title)
 
         if chapter is not None:
             base = prefix_slug or slug_value
@@ -135,25 +192,33 @@ class Transformer(AutoTransformer):
 
         return f"{slug_value}-{index:03d}"
 
-    def _parse_number(self, title: str, pattern: str) -> int | None:
-        match = re.search(pattern, title, re.I)
-        if not match:
-            return None
-        try:
-            return int(match.group(1))
-        except ValueError:
-            return None
-
-    def _prefix_slug(self, title: str) -> str | None:
-        chapter_match = re.search(r"(chapter|part)\s*\d+", title, re.I)
-        prefix = title[: chapter_match.start()] if chapter_match else ""
-        prefix = prefix.strip(" -_:")
-        if not prefix:
-            return None
-        return slugify(prefix)
+    def _parse_title(self, title: str) -> tuple[int | None, int | None, str | None]:
+        """Return the first chapter number, first part number and prefix slug.
+
+        One scan over the title finds both kinds of number; the prefix is
+        whatever precedes the first of them.
+        """
+
+        chapter: int | None = None
+        part: int | None = None
+        prefix_end: int | None = None
+        for match in self._CHAPTER_OR_PART_RE.finditer(title):
+            if prefix_end is None:
+                prefix_end = match.start()
+            kind, number = match.groups()
+            if kind.lower() == "chapter":
+                if chapter is None:
+                    chapter = int(number)
+            elif part is None:
+                part = int(number)
+            if chapter is not None and part is not None:
+                break
+
+        prefix = title[:prefix_end].strip(" -_:") if prefix_end is not None else ""
+        return chapter, part, slugify(prefix) if prefix else None
 
     def _extract_fallback_title(self, html: str) -> str | None:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._make_soup(html, parse_only=self._TITLE_STRAINER)
         if soup.title and soup.title.string:
             text = soup.title.string.strip()
             return text or None
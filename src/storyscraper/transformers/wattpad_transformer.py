@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import soupsieve
 
 from .auto import Transformer as AutoTransformer
 
@@ -10,20 +10,28 @@ from .auto import Transformer as AutoTransformer
 class Transformer(AutoTransformer):
     """Strip Wattpad reader scaffolding before converting to Markdown."""
 
-    _PANEL_SELECTOR = "div.panel-reading"
+    # Compiled once here rather than on every select() call.
+    _HEADER_SELECTOR = soupsieve.compile(".part-header h1")
+    _CONTAINER_SELECTOR = soupsieve.compile("#parts-container-new")
+    _PANEL_SELECTOR = soupsieve.compile("div.panel-reading")
+    _PLACEHOLDER_SELECTOR = soupsieve.compile(".trinityAudioPlaceholder")
 
     def _convert_html_to_markdown(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        header = soup.select_one(".part-header h1")
-        container = soup.select_one("#parts-container-new") or soup
-        panels = container.select(self._PANEL_SELECTOR)
+        soup = self._make_soup(html)
+        header = self._HEADER_SELECTOR.select_one(soup)
+        container = self._CONTAINER_SELECTOR.select_one(soup) or soup
+        panels = self._PANEL_SELECTOR.select(container)
         if panels:
-            fragments: list[str] = []
-            for panel in panels:
-                for placeholder in panel.select(".trinityAudioPlaceholder"):
+            # The panels are moved into a document of their own rather than
+            # serialized and parsed again.
+            document = self._make_soup("")
+            for position, panel in enumerate(panels):
+                for placeholder in self._PLACEHOLDER_SELECTOR.select(panel):
                     placeholder.decompose()
-                fragments.append(str(panel))
-            markdown = super()._convert_html_to_markdown("\n".join(fragments))
+                if position:
+                    document.append("\n")
+                document.append(panel.extract())
+            markdown = self._convert_soup_to_markdown(document)
         else:
             markdown = super()._convert_html_to_markdown(html)
 
@@ -48,14 +48,7 @@ def classify_url(url: str) -> SiteMatch | None:
 
     for rule in _iter_rules():
         if rule.pattern.search(url):
-            return SiteMatch(
-                name=rule.name,
-                full_name=rule.full_name,
-                fetch_agent=rule.fetch_agent,
-                transform_agent=rule.transform_agent,
-                packaging_agent=rule.packaging_agent,
-                documentation=rule.documentation,
-            )
+            return _MATCHES_BY_NAME[rule.name]
     return None
 
 
@@ -68,96 +61,110 @@ def list_site_rules() -> list[SiteRule]:
 def _iter_rules() -> Iterable[SiteRule]:
     """Yield all site rules in priority order."""
 
-    return (
-        SiteRule(
-            pattern=re.compile(r"https?://(?:www\.)?literotica\.com/.*", re.IGNORECASE),
-            name="literotica",
-            full_name="Literotica",
-            fetch_agent="literotica_fetcher",
-            transform_agent="literotica_transformer",
-            documentation="Stories hosted on literotica.com.",
+    return _RULES
+
+
+# Built once at import; classify_url consults it for every URL.
+_RULES: tuple[SiteRule, ...] = (
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?literotica\.com/.*", re.IGNORECASE),
+        name="literotica",
+        full_name="Literotica",
+        fetch_agent="literotica_fetcher",
+        transform_agent="literotica_transformer",
+        documentation="Stories hosted on literotica.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(
+            r"https?://(?:www\.)?eroticstories\.com/my/(?:story|parts)\.php.*",
+            re.IGNORECASE,
         ),
-        SiteRule(
-            pattern=re.compile(
-                r"https?://(?:www\.)?eroticstories\.com/my/(?:story|parts)\.php.*",
-                re.IGNORECASE,
-            ),
-            name="eroticstories",
-            full_name="EroticStories.com",
-            fetch_agent="eroticstories_fetcher",
-            transform_agent="eroticstories_transformer",
-            documentation="Stories hosted on eroticstories.com.",
+        name="eroticstories",
+        full_name="EroticStories.com",
+        fetch_agent="eroticstories_fetcher",
+        transform_agent="eroticstories_transformer",
+        documentation="Stories hosted on eroticstories.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(
+            r"https?://(?:www\.)?bdsmlibrary\.com/stories/.*", re.IGNORECASE
         ),
-        SiteRule(
-            pattern=re.compile(
-                r"https?://(?:www\.)?bdsmlibrary\.com/stories/.*", re.IGNORECASE
-            ),
-            name="bdsmlibrary",
-            full_name="BDSM Library",
-            fetch_agent="bdsmlibrary_fetcher",
-            transform_agent="bdsmlibrary_transformer",
-            documentation="Stories hosted on bdsmlibrary.com.",
+        name="bdsmlibrary",
+        full_name="BDSM Library",
+        fetch_agent="bdsmlibrary_fetcher",
+        transform_agent="bdsmlibrary_transformer",
+        documentation="Stories hosted on bdsmlibrary.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?inkitt\.com/stories/.*", re.IGNORECASE),
+        name="inkitt",
+        full_name="Inkitt",
+        fetch_agent="inkitt_fetcher",
+        transform_agent="inkitt_transformer",
+        documentation="Stories hosted on inkitt.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(
+            r"https?://(?:www\.)?patreon\.com/collection/\d+", re.IGNORECASE
         ),
-        SiteRule(
-            pattern=re.compile(
-                r"https?://(?:www\.)?inkitt\.com/stories/.*", re.IGNORECASE
-            ),
-            name="inkitt",
-            full_name="Inkitt",
-            fetch_agent="inkitt_fetcher",
-            transform_agent="inkitt_transformer",
-            documentation="Stories hosted on inkitt.com.",
-        ),
-        SiteRule(
-            pattern=re.compile(
-                r"https?://(?:www\.)?patreon\.com/collection/\d+", re.IGNORECASE
-            ),
-            name="patreon",
-            full_name="Patreon",
-            fetch_agent="patreon_fetcher",
-            transform_agent="patreon_transformer",
-            documentation="Public Patreon collections (requires cookies for gated posts).",
-        ),
-        SiteRule(
-            pattern=re.compile(r"https?://(?:www\.)?deviantart\.com/.*", re.IGNORECASE),
-            name="deviantart",
-            full_name="DeviantArt",
-            fetch_agent="deviantart_fetcher",
-            transform_agent="deviantart_transformer",
-            documentation="Stories hosted on deviantart.com.",
-        ),
-        SiteRule(
-            pattern=re.compile(r"https?://(?:www\.)?mcstories\.com/.*", re.IGNORECASE),
-            name="mcstories",
-            full_name="The Erotic Mind-Control Story Archive",
-            fetch_agent="mcstories_fetcher",
-            transform_agent="mcstories_transformer",
-            documentation="Stories hosted on mcstories.com.",
-        ),
-        SiteRule(
-            pattern=re.compile(r"https?://(?:www\.)?wattpad\.com/.*", re.IGNORECASE),
-            name="wattpad",
-            full_name="Wattpad",
-            fetch_agent="wattpad_fetcher",
-            transform_agent="wattpad_transformer",
-            documentation="Stories hosted on wattpad.com.",
-        ),
-        SiteRule(
-            pattern=re.compile(
-                r"https?://(?:www\.)?archiveofourown\.org/.*", re.IGNORECASE
-            ),
-            name="ao3",
-            full_name="Archive of Our Own",
-            fetch_agent="ao3_fetcher",
-            transform_agent="ao3_transformer",
-            documentation="Stories hosted on archiveofourown.org.",
-        ),
-        SiteRule(
-            pattern=re.compile(r"https?://(?:www\.)?fanfiction\.net/.*", re.IGNORECASE),
-            name="fanfiction",
-            full_name="FanFiction.Net",
-            fetch_agent="fanfiction_fetcher",
-            transform_agent="fanfiction_transformer",
-            documentation="Stories hosted on fanfiction.net.",
+        name="patreon",
+        full_name="Patreon",
+        fetch_agent="patreon_fetcher",
+        transform_agent="patreon_transformer",
+        documentation="Public Patreon collections (requires cookies for gated posts).",
+    ),
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?deviantart\.com/.*", re.IGNORECASE),
+        name="deviantart",
+        full_name="DeviantArt",
+        fetch_agent="deviantart_fetcher",
+        transform_agent="deviantart_transformer",
+        documentation="Stories hosted on deviantart.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?mcstories\.com/.*", re.IGNORECASE),
+        name="mcstories",
+        full_name="The Erotic Mind-Control Story Archive",
+        fetch_agent="mcstories_fetcher",
+        transform_agent="mcstories_transformer",
+        documentation="Stories hosted on mcstories.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?wattpad\.com/.*", re.IGNORECASE),
+        name="wattpad",
+        full_name="Wattpad",
+        fetch_agent="wattpad_fetcher",
+        transform_agent="wattpad_transformer",
+        documentation="Stories hosted on wattpad.com.",
+    ),
+    SiteRule(
+        pattern=re.compile(
+            r"https?://(?:www\.)?archiveofourown\.org/.*", re.IGNORECASE
         ),
+        name="ao3",
+        full_name="Archive of Our Own",
+        fetch_agent="ao3_fetcher",
+        transform_agent="ao3_transformer",
+        documentation="Stories hosted on archiveofourown.org.",
+    ),
+    SiteRule(
+        pattern=re.compile(r"https?://(?:www\.)?fanfiction\.net/.*", re.IGNORECASE),
+        name="fanfiction",
+        full_name="FanFiction.Net",
+        fetch_agent="fanfiction_fetcher",
+        transform_agent="fanfiction_transformer",
+        documentation="Stories hosted on fanfiction.net.",
+    ),
+)
+# SiteMatch is frozen, so each rule's result is built once and shared.
+_MATCHES_BY_NAME = {
+    rule.name: SiteMatch(
+        name=rule.name,
+        full_name=rule.full_name,
+        fetch_agent=rule.fetch_agent,
+        transform_agent=rule.transform_agent,
+        packaging_agent=rule.packaging_agent,
+        documentation=rule.documentation,
     )
+    for rule in _RULES
+}
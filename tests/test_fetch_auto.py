@@ -215,6 +215,37 @@ def test_run_fetch_phase_skips_existing_files_when_not_forced(
     assert existing_file.read_text(encoding="utf-8") == "old"
 
 
+def test_run_fetch_phase_keeps_chapter_order_with_workers(
+    monkeypatch, tmp_path: Path, options: StoryScraperOptions
+) -> None:
+    story_dir = tmp_path / options.slug
+    download_list = story_dir / "download_urls.txt"
+    urls = [f"https://example.com/story/{index}.html" for index in range(1, 6)]
+    _write_download_list(download_list, urls)
+
+    def fake_fetch_bytes(self, url: str) -> bytes:
+        if url == urls[2]:
+            raise RuntimeError("boom")
+        return f"<html>{url}</html>".encode()
+
+    monkeypatch.setattr(
+        "storyscraper.fetchers.auto.Fetcher._fetch_bytes",
+        fake_fetch_bytes,
+    )
+    options.fetch_workers = 3
+
+    files = run_fetch_phase(options, stories_root=tmp_path)
+
+    assert [file.name for file in files] == [
+        "silver-leash-001.html",
+        "silver-leash-002.html",
+        "silver-leash-004.html",
+        "silver-leash-005.html",
+    ]
+    assert files[2].read_text(encoding="utf-8") == f"<html>{urls[3]}</html>"
+    assert urls[2] in (story_dir / "fetch.log").read_text(encoding="utf-8")
+
+
 def test_run_fetch_phase_respects_force_fetch(
     monkeypatch, tmp_path: Path, options: StoryScraperOptions
 ) -> None:
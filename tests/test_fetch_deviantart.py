@@ -258,3 +258,113 @@ def test_deviantart_fetcher_stops_at_total_pages(
         "https://www.deviantart.com/example_user/art/Chapter-Two-456",
     ]
     assert not any("page=3" in url for url in calls)
+
+
+def test_deviantart_fetcher_prefetches_gallery_pages_with_workers(
+    monkeypatch, tmp_path: Path, deviantart_options: StoryScraperOptions
+) -> None:
+    gallery_url = "https://www.deviantart.com/example_user/gallery/1"
+
+    def _page(number: int) -> str:
+        next_link = (
+            f'<link rel="next" href="{gallery_url}?page={number + 1}">'
+            if number < 3
+            else ""
+        )
+        return f"""
+        <html>
+          <head>
+            {next_link}
+            <script>
+              window.__INITIAL_STATE__ = JSON.parse("{{\\"pageInfo\\":{{\\"currentPage\\":{number},\\"totalPages\\":3}}}}");
+            </script>
+          </head>
+          <body>
+            <a href="https://www.deviantart.com/example_user/art/Chapter-{number}-{number}00">{number}</a>
+          </body>
+        </html>
+        """
+
+    calls: list[str] = []
+
+    def _fake_fetch(self, url: str) -> str:
+        calls.append(url)
+        if "page=" in url:
+            return _page(int(url.rsplit("=", 1)[1]))
+        return _page(1)
+
+    monkeypatch.setattr(
+        "storyscraper.fetchers.deviantart_fetcher.Fetcher._fetch_text",
+        _fake_fetch,
+    )
+
+    gallery_options = replace(
+        deviantart_options, download_url=gallery_url, fetch_workers=2
+    )
+
+    urls = run_fetch_list_phase(gallery_options, stories_root=tmp_path)
+
+    assert urls == [
+        f"https://www.deviantart.com/example_user/art/Chapter-{number}-{number}00"
+        for number in (1, 2, 3)
+    ]
+    assert sorted(calls) == [
+        gallery_url,
+        f"{gallery_url}?page=2",
+        f"{gallery_url}?page=3",
+    ]
+
+
+def test_deviantart_fetcher_skips_prefetch_when_next_link_differs(
+    monkeypatch, tmp_path: Path, deviantart_options: StoryScraperOptions
+) -> None:
+    gallery_url = "https://www.deviantart.com/example_user/gallery/1"
+
+    def _page(number: int) -> str:
+        next_link = (
+            f'<link rel="next" href="{gallery_url}?offset={number * 24}">'
+            if number < 3
+            else ""
+        )
+        return f"""
+        <html>
+          <head>
+            {next_link}
+            <script>
+              window.__INITIAL_STATE__ = JSON.parse("{{\\"pageInfo\\":{{\\"currentPage\\":{number},\\"totalPages\\":3}}}}");
+            </script>
+          </head>
+          <body>
+            <a href="https://www.deviantart.com/example_user/art/Chapter-{number}-{number}00">{number}</a>
+          </body>
+        </html>
+        """
+
+    calls: list[str] = []
+
+    def _fake_fetch(self, url: str) -> str:
+        calls.append(url)
+        if "offset=" in url:
+            return _page(int(url.rsplit("=", 1)[1]) // 24 + 1)
+        return _page(1)
+
+    monkeypatch.setattr(
+        "storyscraper.fetchers.deviantart_fetcher.Fetcher._fetch_text",
+        _fake_fetch,
+    )
+
+    gallery_options = replace(
+        deviantart_options, download_url=gallery_url, fetch_workers=2
+    )
+
+    urls = run_fetch_list_phase(gallery_options, stories_root=tmp_path)
+
+    assert urls == [
+        f"https://www.deviantart.com/example_user/art/Chapter-{number}-{number}00"
+        for number in (1, 2, 3)
+    ]
+    assert calls == [
+        gallery_url,
+        f"{gallery_url}?offset=24",
+        f"{gallery_url}?offset=48",
+    ]
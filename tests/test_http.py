@@ -109,3 +109,12 @@ def test_configure_session_loads_cookies(monkeypatch) -> None:
     assert data == b"payload"
     assert any(cookie.name == "session" for cookie in dummy_session.cookies)
     assert dummy_session.last_headers["User-Agent"].startswith("Mozilla/5.0")
+
+
+def test_new_session_shares_one_pooled_adapter() -> None:
+    session = http._new_session()
+
+    adapter = session.get_adapter("https://example.com")
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == http._POOL_MAXSIZE
+    assert session.get_adapter("http://example.com") is adapter
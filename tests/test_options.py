@@ -166,6 +166,15 @@ def test_parse_cli_args_accepts_sleep_bounds() -> None:
     assert options.sleep_max == 2.5
 
 
+def test_parse_cli_args_accepts_fetch_workers() -> None:
+    url = "https://example.com/story"
+
+    assert parse_cli_args([url]).fetch_workers == 1
+    assert parse_cli_args(["--fetch-workers", "4", url]).fetch_workers == 4
+    with pytest.raises(SystemExit):
+        parse_cli_args(["-j", "0", url])
+
+
 def test_parse_cli_args_accepts_from_file(tmp_path: Path) -> None:
     url_file = tmp_path / "urls.txt"
     url_file.write_text(
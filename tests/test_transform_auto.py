@@ -1,10 +1,14 @@
+import importlib
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 from bs4 import BeautifulSoup
 
+from storyscraper import transformers
 from storyscraper.options import StoryScraperOptions
 from storyscraper.transform import run_transform_phase
+from storyscraper.transformers import load_transformer
 from storyscraper.transformers.auto import Transformer
 
 
@@ -62,6 +66,50 @@ def test_extract_content_falls_back_to_body_structure() -> None:
     assert "Body content" in root.get_text()
 
 
+def test_extract_content_structure_skips_nested_chrome() -> None:
+    transformer = Transformer()
+    html = """
+    <html>
+        <body>
+            <div class="content">
+                <h1>Heading</h1>
+                <nav>Previous | Next</nav>
+                <p>Body content</p>
+            </div>
+        </body>
+    </html>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    root = transformer.extract_content_root(soup)
+
+    assert root.name == "div"
+    assert "Body content" in root.get_text()
+    assert "Previous" not in root.get_text()
+    assert soup.find("nav") is not None
+
+
+def test_extract_content_structure_returns_detached_copy() -> None:
+    transformer = Transformer()
+    html = """
+    <html>
+        <body>
+            <div class="content">
+                <h1>Heading</h1>
+                <p>Body content</p>
+            </div>
+        </body>
+    </html>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    root = transformer.extract_content_root(soup)
+    root.find("p").decompose()
+
+    assert root.name == "div"
+    assert soup.find("p") is not None
+
+
 def test_transform_phase_writes_markdown_files(
     monkeypatch, tmp_path: Path, options: StoryScraperOptions
 ) -> None:
@@ -95,3 +143,44 @@ def test_transform_phase_writes_markdown_files(
     assert output.exists()
     contents = output.read_text(encoding="utf-8")
     assert "Hello world" in contents
+
+
+def test_load_transformer_reuses_resolved_class(monkeypatch) -> None:
+    imported: list[str] = []
+
+    def tracking_import(name: str) -> ModuleType:
+        imported.append(name)
+        return importlib.import_module(name)
+
+    monkeypatch.setattr(transformers, "import_module", tracking_import)
+    transformers._transformer_class.cache_clear()
+
+    first = load_transformer("ao3_transformer")
+    second = load_transformer("ao3_transformer")
+
+    assert imported == ["storyscraper.transformers.ao3_transformer"]
+    assert first is not second
+    assert isinstance(load_transformer(""), Transformer)
+
+
+def test_convert_in_parallel_runs_in_worker_processes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    html_paths = []
+    for index in range(1, 4):
+        html_path = tmp_path / f"chapter-{index:03d}.html"
+        html_path.write_text(
+            f"<html><body><main><p>Chapter {index}.</p></main></body></html>",
+            encoding="utf-8",
+        )
+        html_paths.append(html_path)
+    html_paths.append(tmp_path / "missing.html")
+    monkeypatch.setattr("storyscraper.transformers.auto.os.cpu_count", lambda: 2)
+    transformer = Transformer()
+    transformer.PARALLEL_MIN_FILES = 1
+
+    results = list(transformer._convert_in_parallel("_convert_html_file", html_paths))
+
+    for index, result in enumerate(results[:3], start=1):
+        assert f"Chapter {index}." in result
+    assert isinstance(results[3], FileNotFoundError)
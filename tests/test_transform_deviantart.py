@@ -5,7 +5,7 @@ from bs4 import BeautifulSoup
 
 from storyscraper.options import StoryScraperOptions
 from storyscraper.transform import run_transform_phase
-from storyscraper.transformers.deviantart_transformer import Transformer
+from storyscraper.transformers.deviantart_transformer import Transformer, _HtmlDocument
 
 
 def test_deviantart_transformer_prefers_deviation_body() -> None:
@@ -206,3 +206,118 @@ def test_deviantart_transformer_uses_tiptap_when_unavailable(tmp_path: Path) ->
         encoding="utf-8"
     )
     assert "Recovered text." in markdown
+
+
+def test_deviantart_transformer_extracts_metadata_without_initial_state() -> None:
+    html = """
+    <html>
+      <head>
+        <meta property="og:title" content="Jack &amp; Monica by stevemnd on DeviantArt">
+      </head>
+      <body>
+        <a data-tagname="asfr" href="/tag/asfr">#asfr</a>
+        <a data-tagname=" costume " href="/tag/costume">#costume</a>
+        <a data-tagname="asfr" href="/tag/asfr">#asfr</a>
+      </body>
+    </html>
+    """
+    transformer = Transformer()
+
+    title, author, tags, stats, badges, extra = transformer._extract_metadata(html)
+
+    assert title == "Jack & Monica"
+    assert author == "stevemnd"
+    assert tags == ["asfr", "costume"]
+    assert stats is None
+    assert badges is None
+    assert extra == {}
+
+
+def test_deviantart_transformer_extracts_tags_from_awkward_anchors() -> None:
+    transformer = Transformer()
+    html = '<a title="a>b" data-tagname="asfr">#asfr</a><a/data-tagname="costume">'
+
+    assert transformer._extract_tags(html) == ["asfr"]
+    assert transformer._extract_tags('<a href="/x"/data-tagname="costume">') == [
+        "costume"
+    ]
+
+
+def test_deviantart_transformer_decodes_initial_state_literals() -> None:
+    transformer = Transformer()
+    json_html = (
+        '<script>window.__INITIAL_STATE__ = JSON.parse("{\\"title\\":'
+        '\\"Say \\\\\\");\\\\\\" caf\\u00e9\\"}");</script>'
+    )
+    js_only_html = (
+        "<script>window.__INITIAL_STATE__ = JSON.parse("
+        '"{\\"title\\":\\"It\\\'s\\"}");</script>'
+    )
+
+    assert transformer._extract_initial_state(json_html) == {"title": 'Say ");" café'}
+    assert transformer._extract_initial_state(js_only_html) == {"title": "It's"}
+    assert transformer._extract_initial_state("<html></html>") is None
+
+
+def test_deviantart_transformer_only_falls_back_without_deviation_id() -> None:
+    transformer = Transformer()
+    state: dict[str, object] = {
+        "@@entities": {"deviation": {"111": {"title": "Other story"}}}
+    }
+
+    assert transformer._extract_deviation(state, "222") is None
+    assert transformer._extract_deviation(state, None) == {"title": "Other story"}
+
+
+def test_deviantart_transformer_maps_present_deviation_fields() -> None:
+    transformer = Transformer()
+    deviation: dict[str, object] = {
+        "publishedTime": "2025-10-02T10:00:00-0700",
+        "isMature": False,
+        "url": None,
+        "unrelated": 1,
+    }
+
+    assert transformer._extract_deviation_metadata(deviation) == {
+        "published_time": "2025-10-02T10:00:00-0700",
+        "is_mature": False,
+    }
+    assert transformer._extract_extended_metadata({"stats": {"shares": 2}}) == {
+        "extended_stats": {"shares": 2}
+    }
+
+
+def test_deviantart_transformer_accepts_state_outside_orjson_subset() -> None:
+    transformer = Transformer()
+    html = (
+        "<script>window.__INITIAL_STATE__ = JSON.parse("
+        '"{\\"ratio\\":NaN,\\"id\\":123456789012345678901234567890}");</script>'
+    )
+
+    state = transformer._extract_initial_state(html)
+
+    assert state is not None
+    assert state["id"] == 123456789012345678901234567890
+    assert state["ratio"] != state["ratio"]
+
+
+def test_deviantart_transformer_writes_metadata_as_utf8(tmp_path: Path) -> None:
+    state: dict[str, object] = {
+        "@@DUPERBROWSE": {"rootStream": {"currentOpenItem": 5}},
+        "@@entities": {
+            "deviation": {"5": {"title": "Café \ud800", "author": {"username": "zoë"}}}
+        },
+    }
+    document = _HtmlDocument(
+        path=tmp_path / "html" / "story-001.html",
+        html="<html></html>",
+        initial_state=state,
+    )
+
+    Transformer()._write_metadata(tmp_path, [document])
+
+    raw = (tmp_path / "metadata.json").read_bytes()
+    assert "zoë".encode() in raw
+    entry = json.loads(raw.decode("utf-8"))["5"]
+    assert entry["title"] == "Café \ud800"
+    assert entry["author"] == "zoë"
@@ -20,3 +20,27 @@ def test_fanfiction_transformer_converts_storytext() -> None:
     assert markdown.startswith("# Chapter Title")
     assert "First paragraph." in markdown
     assert "Second paragraph." in markdown
+
+
+def test_fanfiction_transformer_keeps_nested_storytext() -> None:
+    html = """
+    <html>
+        <head><script>var node = "</div>"; $('#storytext').show();</script></head>
+        <body>
+            <div id='content_wrapper'>
+                <div class='storytext xcontrast_txt nocopy' id='storytext'>
+                    <div class='inner'><p>First paragraph.</p></div>
+                    <p>Second paragraph.</p>
+                </div>
+                <div id='profile_top'>Review this story</div>
+            </div>
+        </body>
+    </html>
+    """
+
+    transformer = Transformer()
+    markdown = transformer._convert_html_to_markdown(html)  # type: ignore[attr-defined]
+
+    assert "First paragraph." in markdown
+    assert "Second paragraph." in markdown
+    assert "Review this story" not in markdown
@@ -69,3 +69,28 @@ def test_literotica_transformer_converts_tilde_fences_to_hr() -> None:
     assert "# Fence Test" in markdown
     assert "---" in markdown
     assert "~~~" not in markdown
+
+
+def test_literotica_transformer_keeps_non_ascii_page_text() -> None:
+    html = """
+    <html><body>
+    pageText:"Café au lait \\u2014 it\\'s \\"fine\\"."
+    </body></html>
+    """
+
+    transformer = Transformer()
+    markdown = transformer._convert_html_to_markdown(html)  # type: ignore[attr-defined]
+
+    assert 'Café au lait — it\'s "fine".' in markdown
+
+
+def test_literotica_transformer_reads_heading_from_unusual_script_tags() -> None:
+    transformer = Transformer()
+    quoted = (
+        "<SCRIPT data-note=\"a>b\" type='application/ld+json'>"
+        f"{_article_ld_json()}</SCRIPT>"
+    )
+    slashed = f'<script/type="application/ld+json">{_article_ld_json()}</script>'
+
+    assert transformer._extract_heading(quoted) == "Harem House - Selene Pt. 01"
+    assert transformer._extract_heading(slashed) == "Harem House - Selene Pt. 01"
@@ -7,7 +7,9 @@ from storyscraper.options import StoryScraperOptions
 from storyscraper.transformers.patreon_transformer import Transformer
 
 
-def _next_data_html(title: str, body: str) -> str:
+def _next_data_html(title: str, body: str, *, content: str | None = None) -> str:
+    if content is None:
+        content = f"<div><p>{body}</p><div>In collection footer</div></div>"
     payload = {
         "props": {
             "pageProps": {
@@ -17,7 +19,7 @@ def _next_data_html(title: str, body: str) -> str:
                             "data": {
                                 "attributes": {
                                     "title": title,
-                                    "content": f"<div><p>{body}</p><div>In collection footer</div></div>",
+                                    "content": content,
                                 }
                             }
                         }
@@ -45,6 +47,20 @@ def test_patreon_transformer_extracts_post_content() -> None:
     assert "The forest embraces us like a protective mother." in markdown
 
 
+def test_patreon_transformer_drops_top_level_collection_marker() -> None:
+    html = _next_data_html(
+        "Loose Marker",
+        "",
+        content="In collection Summer Stories<p>Only the body remains.</p>",
+    )
+    transformer = Transformer()
+    markdown = transformer._convert_html_to_markdown(html)  # type: ignore[attr-defined]
+
+    assert markdown.startswith("# Loose Marker")
+    assert "Only the body remains." in markdown
+    assert "In collection" not in markdown
+
+
 def test_patreon_transformer_sanitizes_tilde_fences() -> None:
     html = _next_data_html(
         "Fence Check",
@@ -88,3 +104,19 @@ def test_patreon_transformer_renames_output_by_title(tmp_path: Path) -> None:
     expected = stories_root / slug / "markdown" / "blabla-043-4.md"
     assert expected in outputs
     assert expected.exists()
+
+
+def test_patreon_transformer_reads_fallback_title() -> None:
+    transformer = Transformer()
+
+    assert (
+        transformer._extract_fallback_title(
+            "<html><head><title> Plain Title </title></head><body><p>x</p></body>"
+        )
+        == "Plain Title"
+    )
+    assert (
+        transformer._extract_fallback_title("<title>Tom &amp; Jerry</title>")
+        == "Tom & Jerry"
+    )
+    assert transformer._extract_fallback_title("<p>No title</p>") is None